@@ -50,18 +50,31 @@ __all__ = [
     "remove_account",
 ]
 
-# Optional Antigravity chat model export
-try:  # pragma: no cover
-    from .chat_model import ChatAntigravity
+# Chat models pull in langchain-core (and ChatCopilot the Copilot SDK), so
+# they are imported on first attribute access; auth-only CLIs stay fast.
+_LAZY_CHAT_MODELS = {
+    "ChatAntigravity": ".chat_model",
+    "ChatCodex": ".codex_chat_model",
+    "ChatCopilot": ".copilot_chat_model",
+}
 
-    __all__.insert(0, "ChatAntigravity")
-except Exception:
-    pass
+
+def __getattr__(name: str):
+    module_name = _LAZY_CHAT_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__.insert(0, "ChatAntigravity")
 
 
 # Optional Codex exports
 try:  # pragma: no cover
-    from .codex_chat_model import ChatCodex
     from .codex_auth import (
         CodexAuth,
         authorize_codex,
@@ -105,7 +118,6 @@ except Exception:
 
 # Optional Copilot exports
 try:  # pragma: no cover
-    from .copilot_chat_model import ChatCopilot
     from .copilot_auth import (
         CopilotAuth,
         request_copilot_device_code,
@@ -118,6 +130,7 @@ try:  # pragma: no cover
         set_active_copilot_account,
         remove_copilot_account,
         verify_copilot_token,
+        aclose_copilot_http_client,
     )
 
     __all__ += [
@@ -133,6 +146,7 @@ try:  # pragma: no cover
         "set_active_copilot_account",
         "remove_copilot_account",
         "verify_copilot_token",
+        "aclose_copilot_http_client",
     ]
 except Exception:
     # Copilot support not available in this installation.
@@ -0,0 +1,62 @@
+"""Shared helpers for the live test scripts (test_antigravity.py, test_both.py).
+
+Tests run concurrently under ``asyncio.gather``; each one's output is captured
+into its own buffer and replayed in order once all of them finish.
+"""
+
+import contextlib
+import contextvars
+import io
+import sys
+import traceback
+
+# Per-test output buffer; tests run concurrently, so their prints are captured
+# and replayed in order once all of them finish.
+_test_output: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar(
+    "_test_output", default=None
+)
+
+
+class _BufferedStdout:
+    """Route writes to the current test's buffer, or to the real stdout."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _test_output.get()
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        if _test_output.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def _run_test(name, coro, semaphore=None):
+    """Run one test with its output captured; returns (name, passed, output)."""
+    buffer = io.StringIO()
+    _test_output.set(buffer)
+    async with semaphore or contextlib.nullcontext():
+        try:
+            await coro
+            result = True
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            traceback.print_exc(file=sys.stdout)
+            result = False
+    return name, result, buffer.getvalue()
+
+
+async def _prepare_auth(loader, refresher):
+    """Load stored auth once and refresh it only if it has expired."""
+    auth = loader()
+    if auth is None:
+        return None
+    if auth.is_expired():
+        print("  Token expired, refreshing...")
+        auth = await refresher(auth)
+        print("  ✓ Token refreshed")
+    return auth
@@ -39,6 +39,7 @@ except Exception:  # pragma: no cover
 
 from .chat_model_helpers import (
     _env_project_override,
+    _request_client,
     _resolve_auth_project_id,
     _retry_after_seconds,
     get_header_style,
@@ -47,7 +48,7 @@ from .chat_model_helpers import (
     is_thinking_model,
     resolve_model_name,
 )
-from .usage_helpers import _extract_usage_metadata, _normalize_token_usage
+from .usage_helpers import _extract_usage_metadata_fast, _normalize_token_usage
 from .chat_message_utils import convert_messages
 
 
@@ -116,6 +117,9 @@ class ChatAntigravity(BaseChatModel):
     auth: AntigravityAuth | None = Field(default=None, exclude=True)
     """Authentication state. If not provided, will load from storage."""
     
+    http_client: httpx.AsyncClient | None = Field(default=None, exclude=True)
+    """Optional shared HTTP client. The caller owns it and must close it."""
+    
     project_id: str | None = Field(default=None)
     """Optional project ID override (takes precedence over env/auth)."""
     
@@ -283,7 +287,7 @@ class ChatAntigravity(BaseChatModel):
         
         content = "".join(text_parts)
 
-        usage_metadata, raw_usage = _extract_usage_metadata(response_data)
+        usage_metadata, raw_usage = _extract_usage_metadata_fast(inner)
         response_metadata = {"usage": raw_usage} if raw_usage else {}
 
         return AIMessage(
@@ -321,7 +325,7 @@ class ChatAntigravity(BaseChatModel):
             if is_thinking_model(effective_model) and is_claude_model(effective_model):
                 headers["anthropic-beta"] = "interleaved-thinking-2025-05-14"
 
-            async with httpx.AsyncClient(timeout=120.0) as client:
+            async with _request_client(self.http_client) as client:
                 for endpoint in constants.ANTIGRAVITY_ENDPOINT_FALLBACKS:
                     url = f"{endpoint}/v1internal:generateContent"
 
@@ -458,7 +462,7 @@ class ChatAntigravity(BaseChatModel):
             if is_thinking_model(effective_model) and is_claude_model(effective_model):
                 headers["anthropic-beta"] = "interleaved-thinking-2025-05-14"
 
-            async with httpx.AsyncClient(timeout=120.0) as client:
+            async with _request_client(self.http_client) as client:
                 for endpoint in constants.ANTIGRAVITY_ENDPOINT_FALLBACKS:
                     url = f"{endpoint}/v1internal:streamGenerateContent?alt=sse"
 
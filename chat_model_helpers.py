@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Literal
 
 import httpx
 
@@ -28,6 +29,18 @@ def _retry_after_seconds(response: httpx.Response, *, default: float) -> float:
     return default
 
 
+@asynccontextmanager
+async def _request_client(
+    http_client: httpx.AsyncClient | None, *, timeout: float = 120.0
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the caller's shared client, or a per-request one closed on exit."""
+    if http_client is not None:
+        yield http_client
+        return
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
+
+
 def resolve_model_name(model: str) -> str:
     """Resolve user-facing model names to Antigravity API model IDs."""
     lower = model.strip()
@@ -44,6 +44,7 @@ from .codex_responses import (
     serialize_function_call_output,
     split_bound_tools,
 )
+from .chat_model_helpers import _request_client
 from .usage_helpers import _extract_usage_metadata, _normalize_token_usage
 
 try:
@@ -177,6 +178,9 @@ class ChatCodex(BaseChatModel):
     auth: CodexAuth | None = Field(default=None, exclude=True)
     """Authentication state. If not provided, will load from storage."""
 
+    http_client: httpx.AsyncClient | None = Field(default=None, exclude=True)
+    """Optional shared HTTP client. The caller owns it and must close it."""
+
     account_id: str | None = Field(default=None)
     """Optional ChatGPT account ID override."""
 
@@ -1209,7 +1213,7 @@ class ChatCodex(BaseChatModel):
         # IMPORTANT: Codex uses /codex/responses (not /responses).
         url = f"{CODEX_BASE_URL}/codex/responses"
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with _request_client(self.http_client) as client:
             combined_output_items: list[dict[str, Any]] = []
             handled_tool_calls: list[dict[str, Any]] = []
             handled_computer_calls: list[dict[str, Any]] = []
@@ -1378,7 +1382,7 @@ class ChatCodex(BaseChatModel):
 
         url = f"{CODEX_BASE_URL}/codex/responses"
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with _request_client(self.http_client) as client:
             unauthorized_retry_attempted = False
             handled_tool_calls: list[dict[str, Any]] = []
             handled_computer_calls: list[dict[str, Any]] = []
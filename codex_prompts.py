@@ -10,16 +10,31 @@ requests compatible with the backend.
 
 from __future__ import annotations
 
+import gzip
 import json
 import os
 import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import httpx
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 GITHUB_API_RELEASES = "https://api.github.com/repos/openai/codex/releases/latest"
 GITHUB_HTML_RELEASES = "https://github.com/openai/codex/releases/latest"
@@ -49,6 +64,14 @@ CACHE_FILES: dict[ModelFamily, str] = {
 }
 
 
+# Optional override for power-users, resolved once at import time.
+_ENV_OVERRIDE = os.getenv("LANGCHAIN_ANTIGRAVITY_CODEX_INSTRUCTIONS") or None
+_ENV_OVERRIDE_ANNOUNCED: set[ModelFamily] = set()
+
+# Families whose pre-gzip ``{name}.md`` cache has been migrated this process.
+_LEGACY_CACHE_CHECKED: set[ModelFamily] = set()
+
+
 @dataclass
 class _CacheMetadata:
     etag: str | None
@@ -86,7 +109,7 @@ def get_model_family(normalized_model: str) -> ModelFamily:
 
 def _read_metadata(meta_path: Path) -> _CacheMetadata:
     try:
-        data = json.loads(meta_path.read_text(encoding="utf-8"))
+        data = _json_loads(meta_path.read_bytes())
         return _CacheMetadata(
             etag=data.get("etag"),
             tag=data.get("tag"),
@@ -97,18 +120,55 @@ def _read_metadata(meta_path: Path) -> _CacheMetadata:
         return _CacheMetadata(etag=None, tag=None, last_checked=None, url=None)
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    # Write to a sibling temp file and swap it in so readers never see a
+    # partially written cache file after an unclean shutdown.
+    tmp_path = path.with_suffix(f"{path.suffix}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_cached_instructions(cache_file: Path) -> str | None:
+    # A truncated or corrupt cache file is a cache miss; drop it so the next
+    # fetch neither sends its ETag nor falls back to it.
+    try:
+        return gzip.decompress(cache_file.read_bytes()).decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError):
+        cache_file.unlink(missing_ok=True)
+        return None
+
+
+def _write_cached_instructions(cache_file: Path, instructions: str) -> None:
+    # Prompt markdown compresses well; keep the on-disk copy gzipped.
+    _atomic_write_bytes(cache_file, gzip.compress(instructions.encode("utf-8")))
+
+
+def _migrate_legacy_cache(legacy_file: Path, cache_file: Path) -> None:
+    # Earlier versions cached the prompt as plain markdown; gzip it into the
+    # current cache file (unless one already exists) and remove the original.
+    try:
+        if not cache_file.exists():
+            _write_cached_instructions(cache_file, legacy_file.read_text(encoding="utf-8"))
+        legacy_file.unlink()
+    except (OSError, UnicodeDecodeError):
+        legacy_file.unlink(missing_ok=True)
+
+
 def _write_metadata(meta_path: Path, meta: _CacheMetadata) -> None:
-    meta_path.write_text(
-        json.dumps(
+    _atomic_write_bytes(
+        meta_path,
+        _json_dumps(
             {
                 "etag": meta.etag,
                 "tag": meta.tag,
                 "lastChecked": meta.last_checked,
                 "url": meta.url,
-            },
-            ensure_ascii=False,
-        ),
-        encoding="utf-8",
+            }
+        )
     )
 
 
@@ -146,35 +206,45 @@ def _get_latest_release_tag(client: httpx.Client) -> str:
 def get_codex_instructions(normalized_model: str = "gpt-5.1-codex") -> str:
     """Return the official Codex CLI instructions for this model family.
 
-    Uses a disk cache with ETag and a 15-minute TTL.
+    Uses a gzip-compressed disk cache with ETag and a 15-minute TTL.
 
     To bypass GitHub fetching (e.g., on restricted networks), set the
     LANGCHAIN_ANTIGRAVITY_CODEX_INSTRUCTIONS environment variable to the
-    official Codex prompt content. If set, this function will return that
-    value directly without any network calls or caching.
+    official Codex prompt content before this module is imported. If set,
+    this function will return that value directly without any network calls
+    or caching.
     """
 
-    # Optional override for power-users.
-    env_override = os.getenv("LANGCHAIN_ANTIGRAVITY_CODEX_INSTRUCTIONS")
-    if env_override:
-        print(f"[langchain_antigravity] Using LANGCHAIN_ANTIGRAVITY_CODEX_INSTRUCTIONS override for {normalized_model}")
-        return env_override
-
     model_family = get_model_family(normalized_model)
+
+    if _ENV_OVERRIDE is not None:
+        if model_family not in _ENV_OVERRIDE_ANNOUNCED:
+            _ENV_OVERRIDE_ANNOUNCED.add(model_family)
+            print(f"[langchain_antigravity] Using LANGCHAIN_ANTIGRAVITY_CODEX_INSTRUCTIONS override for {normalized_model}")
+        return _ENV_OVERRIDE
+
     prompt_file = PROMPT_FILES[model_family]
 
     cache_dir = _cache_dir()
-    cache_file = cache_dir / CACHE_FILES[model_family]
+    cache_file = cache_dir / f"{CACHE_FILES[model_family]}.gz"
     meta_file = cache_dir / (CACHE_FILES[model_family].replace(".md", "-meta.json"))
 
     cache_dir.mkdir(parents=True, exist_ok=True)
 
+    if model_family not in _LEGACY_CACHE_CHECKED:
+        _LEGACY_CACHE_CHECKED.add(model_family)
+        legacy_file = cache_dir / CACHE_FILES[model_family]
+        if legacy_file.exists():
+            _migrate_legacy_cache(legacy_file, cache_file)
+
     meta = _read_metadata(meta_file) if meta_file.exists() else _CacheMetadata(None, None, None, None)
 
     # Rate limit protection: if checked within 15 minutes and we have a file, use it.
     ttl_seconds = 15 * 60
     if meta.last_checked and (time.time() - float(meta.last_checked)) < ttl_seconds and cache_file.exists():
-        return cache_file.read_text(encoding="utf-8")
+        cached = _read_cached_instructions(cache_file)
+        if cached is not None:
+            return cached
 
     try:
         with httpx.Client(timeout=20.0, follow_redirects=True) as client:
@@ -184,22 +254,24 @@ def get_codex_instructions(normalized_model: str = "gpt-5.1-codex") -> str:
             headers: dict[str, str] = {}
             if meta.tag != latest_tag:
                 meta.etag = None
-            if meta.etag:
+            if meta.etag and cache_file.exists():
                 headers["If-None-Match"] = meta.etag
 
             resp = client.get(url, headers=headers)
 
             if resp.status_code == 304 and cache_file.exists():
-                meta.tag = latest_tag
-                meta.last_checked = time.time()
-                meta.url = url
-                _write_metadata(meta_file, meta)
-                return cache_file.read_text(encoding="utf-8")
+                cached = _read_cached_instructions(cache_file)
+                if cached is not None:
+                    meta.tag = latest_tag
+                    meta.last_checked = time.time()
+                    meta.url = url
+                    _write_metadata(meta_file, meta)
+                    return cached
 
             resp.raise_for_status()
 
             instructions = resp.text
-            cache_file.write_text(instructions, encoding="utf-8")
+            _write_cached_instructions(cache_file, instructions)
 
             meta.etag = resp.headers.get("etag")
             meta.tag = latest_tag
@@ -212,7 +284,9 @@ def get_codex_instructions(normalized_model: str = "gpt-5.1-codex") -> str:
     except Exception as exc:
         # If GitHub is blocked/unavailable, try stale cache.
         if cache_file.exists():
-            return cache_file.read_text(encoding="utf-8")
+            cached = _read_cached_instructions(cache_file)
+            if cached is not None:
+                return cached
 
         raise RuntimeError(
             "Failed to fetch Codex instructions from GitHub, and no cache is available. "
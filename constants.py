@@ -5,6 +5,7 @@ Based on opencode-antigravity-auth by NoeFabris:
 https://github.com/NoeFabris/opencode-antigravity-auth
 """
 
+import functools
 import importlib
 import os
 
@@ -38,18 +39,15 @@ ANTIGRAVITY_ENDPOINT_DAILY = "https://daily-cloudcode-pa.sandbox.googleapis.com"
 ANTIGRAVITY_ENDPOINT_AUTOPUSH = "https://autopush-cloudcode-pa.sandbox.googleapis.com"
 ANTIGRAVITY_ENDPOINT_PROD = "https://cloudcode-pa.googleapis.com"
 
-ANTIGRAVITY_ENDPOINT_FALLBACKS = [
-    # Prefer prod first; sandbox endpoints can return 403 for some accounts/projects.
+# Prefer prod first; sandbox endpoints can return 403 for some accounts/projects.
+ANTIGRAVITY_ENDPOINTS = (
     ANTIGRAVITY_ENDPOINT_PROD,
     ANTIGRAVITY_ENDPOINT_DAILY,
     ANTIGRAVITY_ENDPOINT_AUTOPUSH,
-]
+)
 
-ANTIGRAVITY_LOAD_ENDPOINTS = [
-    ANTIGRAVITY_ENDPOINT_PROD,
-    ANTIGRAVITY_ENDPOINT_DAILY,
-    ANTIGRAVITY_ENDPOINT_AUTOPUSH,
-]
+ANTIGRAVITY_ENDPOINT_FALLBACKS = ANTIGRAVITY_ENDPOINTS
+ANTIGRAVITY_LOAD_ENDPOINTS = ANTIGRAVITY_ENDPOINTS
 
 ANTIGRAVITY_ENDPOINT = ANTIGRAVITY_ENDPOINT_DAILY
 GEMINI_CLI_ENDPOINT = ANTIGRAVITY_ENDPOINT_PROD
@@ -135,12 +133,16 @@ CODEX_REDIRECT_URI = os.environ.get(
     "http://localhost:1455/auth/callback"
 )
 
+@functools.cache
 def get_codex_redirect_uri() -> str:
     """Get the OAuth redirect URI, adjusting for Docker environments.
     
     In Docker, the dashboard runs on a different host/port than the callback.
     If CODEX_REDIRECT_URI is explicitly set via env var, use that.
     Otherwise, detect Docker and adjust to use the actual API host.
+
+    The result is computed once per process; the environment it inspects is
+    not expected to change at runtime.
     """
     # If explicitly set, respect it
     redirect_from_env = os.environ.get("CODEX_REDIRECT_URI")
@@ -247,6 +249,16 @@ CODEX_MODEL_MAPPINGS = {
 ANTIGRAVITY_MODEL_PREFIX = "antigravity-"
 CODEX_MODEL_PREFIX = "openai/"
 
+_COPILOT_CLIENT_ID_ATTRS = (
+    "CLIENT_ID",
+    "DEFAULT_CLIENT_ID",
+    "DEFAULT_COPILOT_CLIENT_ID",
+    "GITHUB_CLIENT_ID",
+    "COPILOT_CLIENT_ID",
+)
+
+
+@functools.cache
 def _resolve_copilot_client_id() -> str:
     explicit = os.environ.get("COPILOT_CLIENT_ID", "").strip()
     if explicit:
@@ -255,29 +267,28 @@ def _resolve_copilot_client_id() -> str:
         value = os.environ.get(key, "").strip()
         if value:
             return value
+    modules = []
     for module_name in ("copilot", "copilot.constants"):
         try:
-            module = importlib.import_module(module_name)
+            modules.append(importlib.import_module(module_name))
         except Exception:
             continue
-        for attr in (
-            "CLIENT_ID",
-            "DEFAULT_CLIENT_ID",
-            "DEFAULT_COPILOT_CLIENT_ID",
-            "GITHUB_CLIENT_ID",
-            "COPILOT_CLIENT_ID",
-        ):
+    # Well-known attribute names first; only scan module namespaces if none match.
+    for module in modules:
+        for attr in _COPILOT_CLIENT_ID_ATTRS:
             value = getattr(module, attr, None)
             if isinstance(value, str) and value.strip():
                 return value.strip()
-        for attr, value in vars(module).items():
+    for module in modules:
+        for attr, value in module.__dict__.items():
             if "CLIENT_ID" in attr and isinstance(value, str) and value.strip():
                 return value.strip()
     return "Ov23li8tweQw6odWQebz"
 
 
 # GitHub Copilot OAuth Constants
-COPILOT_CLIENT_ID = _resolve_copilot_client_id()
+# COPILOT_CLIENT_ID is resolved on first access (see __getattr__ below) so that
+# importing this module does not import github-copilot-sdk.
 COPILOT_CLIENT_SECRET = os.environ.get("COPILOT_CLIENT_SECRET", "")
 COPILOT_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
 COPILOT_TOKEN_URL = "https://github.com/login/oauth/access_token"
@@ -289,3 +300,9 @@ COPILOT_REDIRECT_URI = os.environ.get(
 COPILOT_API_BASE = "https://api.github.com"
 COPILOT_DOMAIN = os.environ.get("COPILOT_DOMAIN", "").strip()
 COPILOT_ENTERPRISE_URL = os.environ.get("COPILOT_ENTERPRISE_URL", "").strip()
+
+
+def __getattr__(name: str) -> str:
+    if name == "COPILOT_CLIENT_ID":
+        return _resolve_copilot_client_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
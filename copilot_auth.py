@@ -9,16 +9,33 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import importlib.util
 import json
+import random
 import time
-import webbrowser
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import httpx
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 try:
     from . import constants
 except ImportError:  # pragma: no cover
@@ -26,9 +43,58 @@ except ImportError:  # pragma: no cover
 
 
 OAUTH_POLLING_SAFETY_MARGIN_MS = 3000
+OAUTH_POLLING_MAX_DELAY_MS = 15000
+
+# Multiplex device-code polls and profile lookups over one HTTP/2 connection
+# when the optional h2 package is present (installed via httpx[http2]).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One client per event loop: connections are bound to the loop that opened
+# them, and entries disappear with their loop instead of being overwritten
+# (and leaked) when another loop asks for a client.
+_HTTP_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+# Sent on every request from the shared client; call sites only add
+# Authorization (and the device-flow endpoints override Accept).
+_GITHUB_DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "langchain-antigravity/copilot",
+}
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared AsyncClient for GitHub auth calls.
+
+    Each event loop gets its own client (e.g. successive asyncio.run calls),
+    so a client is never replaced while it still owns open connections.
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=_GITHUB_DEFAULT_HEADERS,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_copilot_http_client() -> None:
+    """Close the running loop's GitHub auth HTTP client, if one is open."""
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CopilotAuth:
     access_token: str
     expires_at: float
@@ -41,7 +107,7 @@ class CopilotAuth:
     def is_expired(self, buffer_seconds: int = 60) -> bool:
         if not self.expires_at:
             return False
-        return time.time() >= (self.expires_at - buffer_seconds)
+        return time.time() >= self.expires_at - buffer_seconds
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -67,7 +133,7 @@ class CopilotAuth:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CopilotAccountStorage:
     version: int = 1
     accounts: list[dict[str, Any]] = field(default_factory=list)
@@ -93,11 +159,9 @@ def get_copilot_accounts_path() -> Path:
 
 def load_copilot_accounts() -> CopilotAccountStorage | None:
     path = get_copilot_accounts_path()
-    if not path.exists():
-        return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
         return CopilotAccountStorage(
             version=data.get("version", 1),
             accounts=data.get("accounts", []),
@@ -115,14 +179,36 @@ def save_copilot_accounts(storage: CopilotAccountStorage) -> None:
         "accounts": storage.accounts,
         "activeIndex": storage.active_index,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    # Write a sibling temp file and swap it in so a crash or a concurrent
+    # login never leaves a truncated accounts.json behind.
+    tmp_path = path.with_suffix(f"{path.suffix}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps_indented(payload))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+async def _aload_copilot_accounts() -> CopilotAccountStorage | None:
+    return await asyncio.to_thread(load_copilot_accounts)
+
+
+async def _asave_copilot_accounts(storage: CopilotAccountStorage) -> None:
+    await asyncio.to_thread(save_copilot_accounts, storage)
 
 
 def normalize_domain(url: str) -> str:
-    cleaned = url.replace("https://", "").replace("http://", "").strip()
-    cleaned = cleaned.split("/", 1)[0]
-    return cleaned.rstrip("/")
+    cleaned = url.strip()
+    if cleaned.startswith("https://"):
+        cleaned = cleaned[8:]
+    elif cleaned.startswith("http://"):
+        cleaned = cleaned[7:]
+    slash = cleaned.find("/")
+    return cleaned if slash < 0 else cleaned[:slash]
 
 
 def _resolve_copilot_domain(enterprise_url: str | None = None) -> str:
@@ -152,10 +238,55 @@ def _get_device_urls(domain: str) -> dict[str, str]:
     }
 
 
+def _error_body(response: httpx.Response) -> str:
+    return response.content[:512].decode("utf-8", "replace")
+
+
+def _parse_response(response: httpx.Response, error_prefix: str) -> dict[str, Any]:
+    """Decode a JSON object body, raising ``ValueError`` for non-2xx responses."""
+    content = response.content
+    if not response.is_success:
+        raise ValueError(f"{error_prefix}: {response.status_code} {_error_body(response)}")
+    try:
+        payload = _json_loads(content)
+    except json.JSONDecodeError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+async def _with_retry(
+    request: Callable[[], Awaitable[httpx.Response]],
+    *,
+    max_elapsed: float = 30.0,
+    initial: float = 0.5,
+    cap: float = 8.0,
+) -> httpx.Response:
+    """Retry ``request`` on network errors and 5xx responses with jittered backoff.
+
+    Once ``max_elapsed`` seconds have passed the last error is raised, or the
+    last 5xx response returned, so callers keep their usual error handling.
+    """
+    deadline = time.monotonic() + max_elapsed
+    attempt = 0
+    while True:
+        try:
+            response = await request()
+        except httpx.RequestError:
+            if time.monotonic() >= deadline:
+                raise
+        else:
+            if response.status_code < 500 or time.monotonic() >= deadline:
+                return response
+        delay = min(cap, initial * 2**attempt) * random.uniform(0.5, 1.5)
+        await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        attempt += 1
+
+
 async def request_copilot_device_code(
     *,
     scope: str | None = None,
     enterprise_url: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     # OAuth device flow: request user_code + verification_uri, then poll for access_token.
     if not constants.COPILOT_CLIENT_ID:
@@ -163,10 +294,11 @@ async def request_copilot_device_code(
     scope = scope or constants.COPILOT_SCOPE
     domain = _resolve_copilot_domain(enterprise_url)
     urls = _get_device_urls(domain)
+    client = client or _get_http_client()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
+    try:
+        response = await _with_retry(
+            lambda: client.post(
                 urls["DEVICE_CODE_URL"],
                 json={"client_id": constants.COPILOT_CLIENT_ID, "scope": scope},
                 headers={
@@ -174,19 +306,14 @@ async def request_copilot_device_code(
                     "Content-Type": "application/json",
                 },
             )
-        except httpx.RequestError as exc:
-            raise ValueError(
-                "Unable to reach GitHub device endpoint "
-                f"at {urls['DEVICE_CODE_URL']}: {exc}"
-            ) from exc
-
-    if not response.is_success:
-        raise ValueError(f"Failed to initiate device authorization: {response.text}")
+        )
+    except httpx.RequestError as exc:
+        raise ValueError(
+            "Unable to reach GitHub device endpoint "
+            f"at {urls['DEVICE_CODE_URL']}: {exc}"
+        ) from exc
 
-    try:
-        payload = response.json()
-    except json.JSONDecodeError:
-        payload = {}
+    payload = _parse_response(response, "Failed to initiate device authorization")
 
     device_code = payload.get("device_code")
     user_code = payload.get("user_code")
@@ -217,25 +344,32 @@ def _parse_token_payload(payload: dict[str, Any]) -> tuple[str, float]:
     return access_token, expires_in
 
 
+def _next_poll_delay(attempt: int, interval_seconds: int, slow_down_seen: bool) -> float:
+    """Seconds to wait before the next device-code poll.
+
+    Grows exponentially from the server interval up to a plateau, with jitter so
+    concurrent logins do not poll in lockstep. The server interval is always
+    honored as a floor, plus the safety margin once GitHub has asked us to slow down.
+    """
+    delay_ms = min(OAUTH_POLLING_MAX_DELAY_MS, interval_seconds * 1000 * (1.5**attempt))
+    delay_ms *= random.uniform(0.75, 1.25)
+    floor_ms = interval_seconds * 1000
+    if slow_down_seen:
+        floor_ms += OAUTH_POLLING_SAFETY_MARGIN_MS
+    return max(floor_ms, delay_ms) / 1000
+
+
 def _pat_account_id(token: str) -> str:
-    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:12]
+    # Only the first 6 bytes are used; hex-encoding them matches hexdigest()[:12].
+    digest = hashlib.sha256(token.encode("utf-8"), usedforsecurity=False).digest()[:6].hex()
     return f"pat-{digest}"
 
 
-async def _fetch_user_email(
-    client: httpx.AsyncClient,
-    access_token: str,
-    api_base: str,
-) -> str | None:
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github+json",
-    }
-    resp = await client.get(f"{api_base}/user/emails", headers=headers)
+def _parse_user_email(resp: httpx.Response) -> str | None:
     if not resp.is_success:
         return None
     try:
-        emails = resp.json()
+        emails = _json_loads(resp.content)
     except json.JSONDecodeError:
         return None
     if not isinstance(emails, list):
@@ -249,30 +383,96 @@ async def _fetch_user_email(
     return None
 
 
-async def _fetch_account_profile(access_token: str, api_base: str) -> dict[str, Any]:
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github+json",
-    }
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(f"{api_base}/user", headers=headers)
-        if not resp.is_success:
-            return {}
-        try:
-            payload = resp.json()
-        except json.JSONDecodeError:
-            return {}
-        email = payload.get("email")
-        if not email:
-            email = await _fetch_user_email(client, access_token, api_base)
-        payload["email"] = email
-        return payload
+# ETag and parsed body of the last /user response, keyed by a digest of the
+# API base and token so raw tokens are never used as dictionary keys. Kept as a
+# small LRU so rotated tokens don't accumulate for the life of the process.
+_PROFILE_ETAGS_MAX = 32
+_PROFILE_ETAGS: OrderedDict[bytes, tuple[str, dict[str, Any]]] = OrderedDict()
+
+
+def _profile_cache_key(access_token: str, api_base: str) -> bytes:
+    material = f"{api_base}\0{access_token}".encode("utf-8")
+    return hashlib.sha256(material, usedforsecurity=False).digest()[:16]
+
+
+async def _fetch_account_profile(
+    access_token: str,
+    api_base: str,
+    *,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any]:
+    headers = {"Authorization": f"Bearer {access_token}"}
+    cache_key = _profile_cache_key(access_token, api_base)
+    cached = _PROFILE_ETAGS.get(cache_key)
+    if cached:
+        _PROFILE_ETAGS.move_to_end(cache_key)
+    user_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+    client = client or _get_http_client()
+    # The public profile email is often null, so request /user/emails alongside
+    # /user rather than after it.
+    resp, emails_resp = await asyncio.gather(
+        client.get(f"{api_base}/user", headers=user_headers),
+        client.get(f"{api_base}/user/emails", headers=headers),
+        return_exceptions=True,
+    )
+    if isinstance(resp, BaseException):
+        raise resp
+    if resp.status_code == 304 and cached:
+        return dict(cached[1])
+    if not resp.is_success:
+        return {}
+    try:
+        payload = _json_loads(resp.content)
+    except json.JSONDecodeError:
+        return {}
+    email = payload.get("email")
+    if not email and not isinstance(emails_resp, BaseException):
+        email = _parse_user_email(emails_resp)
+    payload["email"] = email
+    etag = resp.headers.get("etag")
+    if etag:
+        _PROFILE_ETAGS[cache_key] = (etag, dict(payload))
+        _PROFILE_ETAGS.move_to_end(cache_key)
+        if len(_PROFILE_ETAGS) > _PROFILE_ETAGS_MAX:
+            _PROFILE_ETAGS.popitem(last=False)
+    return payload
+
+
+def _build_auth_from_profile(
+    access_token: str,
+    expires_at: float,
+    profile: dict[str, Any],
+    domain_value: str,
+    *,
+    fallback_account_id: str | None = None,
+) -> CopilotAuth:
+    """Build a CopilotAuth from a token and its (possibly empty) /user profile."""
+    account_id = profile.get("id")
+    login = profile.get("login")
+    email = profile.get("email")
+    if not isinstance(login, str):
+        login = None
+    if not isinstance(email, str):
+        email = None
+    if account_id is not None:
+        account_id = str(account_id)
+    account_id = account_id or login or email or fallback_account_id
+    return CopilotAuth(
+        access_token=access_token,
+        expires_at=expires_at,
+        account_id=account_id,
+        login=login,
+        email=email,
+        provider=_copilot_provider_id(),
+        enterprise_url=domain_value if _is_enterprise_domain(domain_value) else None,
+    )
 
 
 async def copilot_auth_from_pat(
     token: str,
     *,
     enterprise_url: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> CopilotAuth:
     token = (token or "").strip()
     if not token:
@@ -280,21 +480,13 @@ async def copilot_auth_from_pat(
 
     domain_value = _resolve_copilot_domain(enterprise_url)
     api_base = _resolve_github_api_base(domain_value)
-    profile = await _fetch_account_profile(token, api_base)
-    account_id = str(profile.get("id")) if profile.get("id") is not None else None
-    login = profile.get("login") if isinstance(profile.get("login"), str) else None
-    email = profile.get("email") if isinstance(profile.get("email"), str) else None
-    if not account_id:
-        account_id = login or email or _pat_account_id(token)
-    enterprise_value = domain_value if _is_enterprise_domain(domain_value) else None
-    return CopilotAuth(
-        access_token=token,
-        expires_at=0,
-        account_id=account_id,
-        login=login,
-        email=email,
-        provider=_copilot_provider_id(),
-        enterprise_url=enterprise_value,
+    profile = await _fetch_account_profile(token, api_base, client=client)
+    return _build_auth_from_profile(
+        token,
+        0,
+        profile,
+        domain_value,
+        fallback_account_id=_pat_account_id(token),
     )
 
 
@@ -304,6 +496,7 @@ async def exchange_copilot_device_code(
     interval: int = 5,
     enterprise_url: str | None = None,
     domain: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> CopilotAuth:
     """Poll the device-code token endpoint until an access token is issued."""
     if not constants.COPILOT_CLIENT_ID:
@@ -313,76 +506,62 @@ async def exchange_copilot_device_code(
 
     domain_value = domain or _resolve_copilot_domain(enterprise_url)
     urls = _get_device_urls(domain_value)
+    api_base = _resolve_github_api_base(domain_value)
     interval_seconds = max(1, int(interval or 5))
 
+    # Wall-clock on purpose: expires_at is persisted and compared against
+    # time.time() by CopilotAuth.is_expired().
     start_time = time.time()
+    client = client or _get_http_client()
+    attempt = 0
+    slow_down_seen = False
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        while True:
-            try:
-                response = await client.post(
-                    urls["ACCESS_TOKEN_URL"],
-                    json={
-                        "client_id": constants.COPILOT_CLIENT_ID,
-                        "device_code": device_code,
-                        "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                    },
-                    headers={
-                        "Accept": "application/json",
-                        "Content-Type": "application/json",
-                    },
-                )
-            except httpx.RequestError as exc:
-                raise ValueError(
-                    "Unable to reach GitHub token endpoint "
-                    f"at {urls['ACCESS_TOKEN_URL']}: {exc}"
-                ) from exc
-
-            if not response.is_success:
-                raise ValueError(f"Token polling failed: {response.text}")
-
-            try:
-                token_payload = response.json()
-            except json.JSONDecodeError:
-                token_payload = {}
-
-            access_token = token_payload.get("access_token")
-            if access_token:
-                access_token, expires_in = _parse_token_payload(token_payload)
-                api_base = _resolve_github_api_base(domain_value)
-                profile = await _fetch_account_profile(access_token, api_base)
-                account_id = str(profile.get("id")) if profile.get("id") is not None else None
-                login = profile.get("login") if isinstance(profile.get("login"), str) else None
-                email = profile.get("email") if isinstance(profile.get("email"), str) else None
-                if not account_id:
-                    account_id = login or email
-                enterprise_value = domain_value if _is_enterprise_domain(domain_value) else None
-                return CopilotAuth(
-                    access_token=access_token,
-                    expires_at=start_time + expires_in if expires_in else 0,
-                    account_id=account_id,
-                    login=login,
-                    email=email,
-                    provider=_copilot_provider_id(),
-                    enterprise_url=enterprise_value,
-                )
-
-            error_code = token_payload.get("error")
-            if error_code == "authorization_pending":
-                await asyncio.sleep(interval_seconds + (OAUTH_POLLING_SAFETY_MARGIN_MS / 1000))
-                continue
-            if error_code == "slow_down":
-                new_interval = interval_seconds + 5
-                server_interval = token_payload.get("interval")
-                if isinstance(server_interval, (int, float)) and server_interval > 0:
-                    new_interval = int(server_interval)
-                interval_seconds = max(1, new_interval)
-                await asyncio.sleep(interval_seconds + (OAUTH_POLLING_SAFETY_MARGIN_MS / 1000))
-                continue
-            if error_code:
-                raise ValueError(f"Device authorization failed: {error_code}")
-
-            await asyncio.sleep(interval_seconds + (OAUTH_POLLING_SAFETY_MARGIN_MS / 1000))
+    while True:
+        try:
+            response = await client.post(
+                urls["ACCESS_TOKEN_URL"],
+                json={
+                    "client_id": constants.COPILOT_CLIENT_ID,
+                    "device_code": device_code,
+                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+                },
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(
+                "Unable to reach GitHub token endpoint "
+                f"at {urls['ACCESS_TOKEN_URL']}: {exc}"
+            ) from exc
+
+        token_payload = _parse_response(response, "Token polling failed")
+
+        access_token = token_payload.get("access_token")
+        if access_token:
+            access_token, expires_in = _parse_token_payload(token_payload)
+            profile = await _fetch_account_profile(access_token, api_base, client=client)
+            return _build_auth_from_profile(
+                access_token,
+                start_time + expires_in if expires_in else 0,
+                profile,
+                domain_value,
+            )
+
+        error_code = token_payload.get("error")
+        if error_code == "slow_down":
+            new_interval = interval_seconds + 5
+            server_interval = token_payload.get("interval")
+            if isinstance(server_interval, (int, float)) and server_interval > 0:
+                new_interval = int(server_interval)
+            interval_seconds = max(1, new_interval)
+            slow_down_seen = True
+        elif error_code and error_code != "authorization_pending":
+            raise ValueError(f"Device authorization failed: {error_code}")
+
+        await asyncio.sleep(_next_poll_delay(attempt, interval_seconds, slow_down_seen))
+        attempt += 1
 
 
 def load_copilot_auth_from_storage() -> CopilotAuth | None:
@@ -407,15 +586,20 @@ def list_copilot_accounts() -> list[dict[str, Any]]:
     storage = load_copilot_accounts()
     if not storage:
         return []
-    return [
-        {
-            "account_id": acc.get("account_id", "unknown"),
-            "login": acc.get("login"),
-            "email": acc.get("email"),
-            "active": i == storage.active_index,
-        }
-        for i, acc in enumerate(storage.accounts)
-    ]
+    active_index = storage.active_index
+    accounts: list[dict[str, Any]] = []
+    append = accounts.append
+    for i, acc in enumerate(storage.accounts):
+        get = acc.get
+        append(
+            {
+                "account_id": get("account_id", "unknown"),
+                "login": get("login"),
+                "email": get("email"),
+                "active": i == active_index,
+            }
+        )
+    return accounts
 
 
 def set_active_copilot_account(account_id: str) -> bool:
@@ -444,19 +628,28 @@ def remove_copilot_account(account_id: str) -> bool:
     return False
 
 
-async def verify_copilot_token(auth: CopilotAuth) -> bool:
+async def verify_copilot_token(
+    auth: CopilotAuth,
+    *,
+    client: httpx.AsyncClient | None = None,
+) -> bool:
     if not auth.access_token:
         raise ValueError("Missing access token")
     api_base = _resolve_github_api_base(_resolve_copilot_domain(auth.enterprise_url))
-    headers = {
-        "Authorization": f"Bearer {auth.access_token}",
-        "Accept": "application/vnd.github+json",
-    }
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(f"{api_base}/user", headers=headers)
-        if response.is_success:
-            return True
-        raise ValueError(f"Token validation failed: {response.status_code} {response.text}")
+    headers = {"Authorization": f"Bearer {auth.access_token}"}
+    cached = _PROFILE_ETAGS.get(_profile_cache_key(auth.access_token, api_base))
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    client = client or _get_http_client()
+    response = await _with_retry(lambda: client.get(f"{api_base}/user", headers=headers))
+    # 304 means GitHub accepted the token and the cached profile is current.
+    if response.is_success or (cached and response.status_code == 304):
+        return True
+    raise ValueError(
+        f"Token validation failed: {response.status_code} {_error_body(response)}"
+    )
+
+
 async def copilot_interactive_login(*, enterprise_url: str | None = None) -> CopilotAuth:
     device = await request_copilot_device_code(
         scope=constants.COPILOT_SCOPE,
@@ -470,6 +663,9 @@ async def copilot_interactive_login(*, enterprise_url: str | None = None) -> Cop
     print(f"Enter code: {user_code}")
 
     if verification_uri:
+        # Imported here: webbrowser is only needed for interactive logins.
+        import webbrowser
+
         webbrowser.open(verification_uri)
 
     auth = await exchange_copilot_device_code(
@@ -479,7 +675,7 @@ async def copilot_interactive_login(*, enterprise_url: str | None = None) -> Cop
         enterprise_url=enterprise_url,
     )
 
-    storage = load_copilot_accounts() or CopilotAccountStorage()
+    storage = await _aload_copilot_accounts() or CopilotAccountStorage()
     account_id = auth.account_id or auth.login or auth.email or "unknown"
 
     existing_idx = next(
@@ -487,6 +683,7 @@ async def copilot_interactive_login(*, enterprise_url: str | None = None) -> Cop
         None,
     )
 
+    now_ms = time.time_ns() // 1_000_000
     payload = {
         "account_id": account_id,
         "access_token": auth.access_token,
@@ -495,8 +692,8 @@ async def copilot_interactive_login(*, enterprise_url: str | None = None) -> Cop
         "email": auth.email,
         "provider": auth.provider,
         "enterprise_url": auth.enterprise_url,
-        "addedAt": int(time.time() * 1000),
-        "lastUsed": int(time.time() * 1000),
+        "addedAt": now_ms,
+        "lastUsed": now_ms,
     }
 
     if existing_idx is not None:
@@ -506,7 +703,7 @@ async def copilot_interactive_login(*, enterprise_url: str | None = None) -> Cop
         storage.accounts.append(payload)
         storage.active_index = len(storage.accounts) - 1
 
-    save_copilot_accounts(storage)
+    await _asave_copilot_accounts(storage)
 
     print(f"Authenticated (account: {auth.login or auth.email or account_id})")
     print(f"Credentials saved to {get_copilot_accounts_path()}")
@@ -7,11 +7,15 @@ This wraps the github-copilot-sdk client and exposes it as a LangChain BaseChatM
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
+import hashlib
 import inspect
 import json
 import os
-import shutil
-from typing import Any, AsyncIterator, Callable, Sequence
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, NamedTuple, Sequence
 
 import httpx
 from langchain_core.callbacks import (
@@ -32,36 +36,87 @@ from langchain_core.messages import (
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
 from pydantic import Field, PrivateAttr
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+except ImportError:  # pragma: no cover
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str, ensure_ascii=False)
+
 try:
     from .copilot_auth import CopilotAuth, load_copilot_auth_from_storage
+    from .copilot_cli_util import _coerce_text, _copilot_client_env, _resolve_cli_options
     from .copilot_models import _copilot_api_base
 except Exception:  # pragma: no cover
     from copilot_auth import CopilotAuth, load_copilot_auth_from_storage  # type: ignore
+    from copilot_cli_util import (  # type: ignore
+        _coerce_text,
+        _copilot_client_env,
+        _resolve_cli_options,
+    )
     from copilot_models import _copilot_api_base  # type: ignore
 
 
-try:
-    from copilot import CopilotClient, Tool, ToolResult, SessionEvent  # type: ignore
-    from copilot.generated.session_events import SessionEventType  # type: ignore
-except Exception:  # pragma: no cover
-    CopilotClient = None  # type: ignore[assignment]
-    SessionEvent = Any  # type: ignore[misc, assignment]
-    SessionEventType = None  # type: ignore[assignment]
-    ToolResult = dict[str, Any]  # type: ignore[misc, assignment]
-
-    class Tool:  # type: ignore[no-redef]
-        def __init__(
-            self,
-            *,
-            name: str,
-            description: str = "",
-            handler: Callable[..., Any] | None = None,
-            parameters: dict[str, Any] | None = None,
-        ) -> None:
-            self.name = name
-            self.description = description
-            self.handler = handler
-            self.parameters = parameters or {}
+if TYPE_CHECKING:  # pragma: no cover
+    from copilot import CopilotClient, SessionEvent, Tool, ToolResult  # type: ignore
+else:
+    CopilotClient = SessionEvent = Tool = Any
+    ToolResult = dict[str, Any]
+
+
+class _FallbackTool:
+    """Stand-in for ``copilot.Tool`` when github-copilot-sdk is not installed."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        description: str = "",
+        handler: Callable[..., Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.handler = handler
+        self.parameters = parameters or {}
+
+
+class _CopilotSDK(NamedTuple):
+    client_cls: Any
+    tool_cls: Any
+    # Session events consumed by ChatCopilot._astream: event type -> (queue
+    # event name, payload extractor).
+    stream_events: dict[Any, tuple[str, Callable[[Any], str | None]]]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_copilot_sdk() -> _CopilotSDK:
+    """Import github-copilot-sdk on first use rather than at module import.
+
+    Importing (and patching) the SDK is costly, and auth-only entry points such
+    as ``copilot-auth status`` never need it.
+    """
+    try:
+        from copilot import CopilotClient as client_cls, Tool as tool_cls  # type: ignore
+        from copilot.generated.session_events import SessionEventType  # type: ignore
+    except Exception:  # pragma: no cover
+        return _CopilotSDK(None, _FallbackTool, {})
+
+    _patch_copilot_context_parsing()
+    stream_events = {
+        SessionEventType.ASSISTANT_MESSAGE_DELTA: ("delta", lambda data: _coerce_text(data.delta_content)),
+        SessionEventType.ASSISTANT_MESSAGE: ("final", lambda data: _coerce_text(data.content)),
+        SessionEventType.SESSION_ERROR: (
+            "error",
+            lambda data: getattr(data, "message", "Copilot session error"),
+        ),
+        SessionEventType.SESSION_IDLE: ("done", lambda data: None),
+    }
+    return _CopilotSDK(client_cls, tool_cls, stream_events)
 
 
 def _patch_copilot_context_parsing() -> None:
@@ -80,51 +135,84 @@ def _patch_copilot_context_parsing() -> None:
             context = obj.get("context")
             if isinstance(context, (dict, list)):
                 obj = dict(obj)
-                obj["context"] = json.dumps(context, ensure_ascii=False)
+                obj["context"] = _json_dumps(context)
         return original_from_dict(obj)
 
     _session_events.Data.from_dict = staticmethod(_from_dict)
     _session_events._context_patch_applied = True
 
 
-_patch_copilot_context_parsing()
+_SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+_SYNC_LOOP_LOCK = threading.Lock()
 
 
-def _resolve_cli_path(configured_path: str | None) -> str | None:
-    """Resolve Copilot CLI path to an absolute executable path when possible.
+def _run_sync(coro: Any) -> Any:
+    """Run ``coro`` to completion from synchronous code.
 
-    The Copilot SDK validates cli_path using os.path.exists, so PATH-only values
-    like "copilot" must be converted via shutil.which.
+    Work is dispatched to one long-lived event loop on a daemon thread. This
+    works whether or not the caller already has a running loop (Jupyter,
+    LangServe) and keeps SDK clients cached by ChatCopilot on a loop that
+    outlives the call.
     """
-    raw = (configured_path or "").strip()
-    if raw:
-        expanded = os.path.expanduser(raw)
-        if any(sep in expanded for sep in ("/", "\\")):
-            return expanded
-        located = shutil.which(expanded)
-        return located or expanded
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+            _SYNC_LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_SYNC_LOOP.run_forever,
+                name="copilot-sync-loop",
+                daemon=True,
+            ).start()
+        loop = _SYNC_LOOP
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("ChatCopilot sync methods cannot be called from async tool handlers; use ainvoke.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def _stop_client_soon(client: Any, loop: asyncio.AbstractEventLoop) -> None:
+    """Best-effort ``client.stop()`` for a ChatCopilot that was garbage collected."""
+    if loop.is_closed():
+        return
 
-    # No explicit path configured. If command is on PATH, use absolute path;
-    # otherwise let SDK fall back to its bundled CLI binary.
-    return shutil.which("copilot")
+    def _schedule() -> None:
+        task = loop.create_task(client.stop())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
+    try:
+        loop.call_soon_threadsafe(_schedule)
+    except RuntimeError:
+        pass
+
+
+# Transcript prefix per message class for the SDK prompt: None marks system
+# messages, "" any other message type. Exact classes hit the dict directly;
+# subclasses (e.g. message chunks) are resolved once and then cached.
+_PROMPT_PREFIX_BASES: tuple[tuple[type, str | None], ...] = (
+    (SystemMessage, None),
+    (HumanMessage, "User: "),
+    (AIMessage, "Assistant: "),
+    (ToolMessage, "Tool: "),
+)
+_PROMPT_PREFIXES: dict[type, str | None] = dict(_PROMPT_PREFIX_BASES)
 
-def _coerce_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            if isinstance(item, str):
-                parts.append(item)
-            elif isinstance(item, dict):
-                text = item.get("text") or item.get("content")
-                if text:
-                    parts.append(str(text))
-        return "\n".join(parts).strip()
-    if value is None:
-        return ""
-    return str(value)
+
+def _prompt_prefix(message_type: type) -> str | None:
+    try:
+        return _PROMPT_PREFIXES[message_type]
+    except KeyError:
+        pass
+    prefix: str | None = ""
+    for base, base_prefix in _PROMPT_PREFIX_BASES:
+        if issubclass(message_type, base):
+            prefix = base_prefix
+            break
+    _PROMPT_PREFIXES[message_type] = prefix
+    return prefix
 
 
 def _message_has_image(value: Any) -> bool:
@@ -217,59 +305,111 @@ def _normalize_tool_result(result: Any) -> ToolResult:
     if isinstance(result, str):
         return {"textResultForLlm": result, "resultType": "success"}
     try:
-        json_str = json.dumps(result, default=str)
+        json_str = _json_dumps(result)
     except (TypeError, ValueError):
         json_str = str(result)
     return {"textResultForLlm": json_str, "resultType": "success"}
 
 
+# JSON schemas keyed by pydantic model class, so rebinding the same tools does
+# not rebuild them. Weak keys let dynamically created schema classes go away.
+_SCHEMA_CACHE: weakref.WeakKeyDictionary[type, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _model_schema(model: Any) -> dict[str, Any]:
+    cacheable = isinstance(model, type)
+    if cacheable:
+        cached = _SCHEMA_CACHE.get(model)
+        if cached is not None:
+            return copy.deepcopy(cached)
+    # pydantic v2 models expose model_json_schema(); v1 models only schema().
+    build_schema = getattr(model, "model_json_schema", None) or getattr(model, "schema", None)
+    if build_schema is None:
+        return {}
+    model_schema = build_schema()
+    if not isinstance(model_schema, dict):
+        return {}
+    if cacheable:
+        _SCHEMA_CACHE[model] = copy.deepcopy(model_schema)
+    return model_schema
+
+
 def _tool_schema(tool: Any) -> dict[str, Any]:
     schema: dict[str, Any] = {}
     try:
-        if hasattr(tool, "args_schema") and tool.args_schema:
-            model_schema = tool.args_schema.model_json_schema()
-            if isinstance(model_schema, dict):
-                schema = model_schema
+        # BaseTool.tool_call_schema is the model-facing schema (injected args
+        # removed) and is memoized by recent langchain-core versions.
+        call_schema = getattr(tool, "tool_call_schema", None)
+        if isinstance(call_schema, dict):
+            schema = copy.deepcopy(call_schema)
+        elif call_schema is not None:
+            schema = _model_schema(call_schema)
+        elif hasattr(tool, "args_schema") and tool.args_schema:
+            schema = _model_schema(tool.args_schema)
         elif hasattr(tool, "get_input_schema"):
-            model = tool.get_input_schema()
-            if hasattr(model, "model_json_schema"):
-                model_schema = model.model_json_schema()
-                if isinstance(model_schema, dict):
-                    schema = model_schema
+            schema = _model_schema(tool.get_input_schema())
     except Exception:
         schema = {}
     return schema
 
 
-async def _call_bound_callable(tool: Callable[..., Any], args: dict[str, Any]) -> Any:
-    try:
-        result = tool(**args)
-    except TypeError:
-        result = tool(args)
-    if inspect.isawaitable(result):
-        return await result
-    return result
+def _bound_callable_caller(tool: Callable[..., Any]) -> Callable[[dict[str, Any]], Awaitable[Any]]:
+    """Return an async caller for a plain callable, specialized once at bind time."""
+    if inspect.iscoroutinefunction(tool):
+
+        async def _call_async(args: dict[str, Any]) -> Any:
+            try:
+                coro = tool(**args)
+            except TypeError:
+                coro = tool(args)
+            return await coro
 
+        return _call_async
 
-async def _invoke_langchain_tool(tool: Any, arguments: Any) -> ToolResult:
-    args = arguments or {}
-    result: Any
+    async def _call(args: dict[str, Any]) -> Any:
+        try:
+            result = tool(**args)
+        except TypeError:
+            result = tool(args)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    return _call
+
+
+def _langchain_tool_caller(tool: Any) -> Callable[[Any], Awaitable[Any]]:
+    """Pick how to run a LangChain-style tool once, instead of on every call."""
     if hasattr(tool, "ainvoke"):
-        result = await tool.ainvoke(args)
-    elif hasattr(tool, "invoke"):
-        result = tool.invoke(args)
-    elif hasattr(tool, "arun"):
-        result = await tool.arun(args)
-    elif hasattr(tool, "run"):
-        result = tool.run(args)
-    elif callable(tool):
-        result = await _call_bound_callable(tool, args)
-    else:
-        result = f"Tool {getattr(tool, 'name', 'unknown')} is not callable."
-    return _normalize_tool_result(result)
+        return tool.ainvoke
+    if hasattr(tool, "invoke"):
+        invoke = tool.invoke
+
+        async def _invoke(args: Any) -> Any:
+            return invoke(args)
+
+        return _invoke
+    if hasattr(tool, "arun"):
+        return tool.arun
+    if hasattr(tool, "run"):
+        run = tool.run
+
+        async def _run(args: Any) -> Any:
+            return run(args)
+
+        return _run
+    if callable(tool):
+        return _bound_callable_caller(tool)
+    message = f"Tool {getattr(tool, 'name', 'unknown')} is not callable."
+
+    async def _not_callable(args: Any) -> Any:
+        return message
+
+    return _not_callable
 
 
 def _build_tool(tool: Any) -> Tool | None:
+    tool_cls = _load_copilot_sdk().tool_cls
     if isinstance(tool, dict):
         name = tool.get("name")
         description = tool.get("description") or ""
@@ -277,13 +417,20 @@ def _build_tool(tool: Any) -> Tool | None:
         if not name or not callable(handler):
             return None
 
-        async def _handler(invocation: dict[str, Any]) -> ToolResult:
-            result = handler(invocation)
-            if inspect.isawaitable(result):
-                result = await result
-            return _normalize_tool_result(result)
+        if inspect.iscoroutinefunction(handler):
+
+            async def _handler(invocation: dict[str, Any]) -> ToolResult:
+                return _normalize_tool_result(await handler(invocation))
 
-        return Tool(
+        else:
+
+            async def _handler(invocation: dict[str, Any]) -> ToolResult:
+                result = handler(invocation)
+                if inspect.isawaitable(result):
+                    result = await result
+                return _normalize_tool_result(result)
+
+        return tool_cls(
             name=name,
             description=description,
             handler=_handler,
@@ -293,11 +440,12 @@ def _build_tool(tool: Any) -> Tool | None:
     if hasattr(tool, "name") and hasattr(tool, "description"):
         name = tool.name
         description = tool.description or ""
+        call_tool = _langchain_tool_caller(tool)
 
         async def _handler(invocation: dict[str, Any]) -> ToolResult:
-            return await _invoke_langchain_tool(tool, invocation.get("arguments"))
+            return _normalize_tool_result(await call_tool(invocation.get("arguments") or {}))
 
-        return Tool(
+        return tool_cls(
             name=name,
             description=description,
             handler=_handler,
@@ -307,13 +455,12 @@ def _build_tool(tool: Any) -> Tool | None:
     if callable(tool):
         name = getattr(tool, "__name__", "tool")
         description = getattr(tool, "__doc__", "") or ""
+        call_tool = _bound_callable_caller(tool)
 
         async def _handler(invocation: dict[str, Any]) -> ToolResult:
-            arguments = invocation.get("arguments") or {}
-            result = await _call_bound_callable(tool, arguments)
-            return _normalize_tool_result(result)
+            return _normalize_tool_result(await call_tool(invocation.get("arguments") or {}))
 
-        return Tool(
+        return tool_cls(
             name=name,
             description=description,
             handler=_handler,
@@ -347,6 +494,13 @@ class ChatCopilot(BaseChatModel):
     _tools: list[Tool] = PrivateAttr(default_factory=list)
     _openai_tools: list[dict[str, Any]] = PrivateAttr(default_factory=list)
     _anthropic_tools: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    # SDK transport: one started CopilotClient reused across calls on the same
+    # event loop, rebuilt when the resolved options or credentials change.
+    _client: Any = PrivateAttr(default=None)
+    _client_key: tuple[Any, ...] | None = PrivateAttr(default=None)
+    _client_loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _client_lock: asyncio.Lock | None = PrivateAttr(default=None)
+    _client_finalizer: weakref.finalize | None = PrivateAttr(default=None)
 
     @property
     def _llm_type(self) -> str:
@@ -365,6 +519,7 @@ class ChatCopilot(BaseChatModel):
     ) -> "ChatCopilot":
         if tool_choice == "none":
             new_model = self.model_copy()
+            new_model._reset_client_state()
             new_model._tools = []
             new_model._openai_tools = []
             new_model._anthropic_tools = []
@@ -397,6 +552,7 @@ class ChatCopilot(BaseChatModel):
                 )
 
         new_model = self.model_copy()
+        new_model._reset_client_state()
         new_model._tools = copilot_tools
         new_model._openai_tools = openai_tools
         new_model._anthropic_tools = anthropic_tools
@@ -412,54 +568,42 @@ class ChatCopilot(BaseChatModel):
     def _build_prompt(self, messages: list[BaseMessage]) -> tuple[str, str | None]:
         system_parts: list[str] = []
         conversation_parts: list[str] = []
+        system_append = system_parts.append
+        conversation_append = conversation_parts.append
 
         for msg in messages:
             content = _coerce_text(msg.content)
-            if isinstance(msg, SystemMessage):
+            prefix = _prompt_prefix(type(msg))
+            if prefix is None:
                 if content:
-                    system_parts.append(content)
-            elif isinstance(msg, HumanMessage):
-                conversation_parts.append(f"User: {content}")
-            elif isinstance(msg, AIMessage):
-                conversation_parts.append(f"Assistant: {content}")
-            elif isinstance(msg, ToolMessage):
-                conversation_parts.append(f"Tool: {content}")
-            else:
-                if content:
-                    conversation_parts.append(content)
-
-        system_message = "\n\n".join(system_parts).strip() if system_parts else None
+                    system_append(content)
+            elif prefix:
+                conversation_append(f"{prefix}{content}")
+            elif content:
+                conversation_append(content)
+
+        # strip() is kept: message content itself is not stripped.
+        if not system_parts:
+            system_message = None
+        elif len(system_parts) == 1:
+            system_message = system_parts[0].strip()
+        else:
+            system_message = "\n\n".join(system_parts).strip()
         prompt = "\n\n".join(conversation_parts).strip()
         return prompt, system_message
 
-    def _build_client(self, auth: CopilotAuth | None) -> CopilotClient:
-        if CopilotClient is None:
-            raise ImportError(
-                "github-copilot-sdk is required for ChatCopilot transport='sdk'. "
-                "Use transport='direct' or install github-copilot-sdk."
-            )
-        cli_url = self.cli_url or os.environ.get("COPILOT_CLI_URL")
-        cli_path = _resolve_cli_path(self.cli_path or os.environ.get("COPILOT_CLI_PATH"))
-
-        use_stdio = self.use_stdio
-        if use_stdio is None:
-            env_value = (os.environ.get("COPILOT_USE_STDIO") or "").strip().lower()
-            if env_value:
-                use_stdio = env_value in {"1", "true", "yes", "on"}
-
-        log_level = self.log_level or os.environ.get("COPILOT_LOG_LEVEL") or "info"
-
-        env = os.environ.copy()
-        if auth and auth.access_token:
-            env["GH_TOKEN"] = auth.access_token
-            env["GITHUB_TOKEN"] = auth.access_token
-        if auth and auth.enterprise_url:
-            env["COPILOT_DOMAIN"] = auth.enterprise_url
-
-        options: dict[str, Any] = {
-            "log_level": log_level,
-            "env": env,
-        }
+    def _client_options(self, auth: CopilotAuth | None) -> dict[str, Any]:
+        cli_url, cli_path, use_stdio, log_level = _resolve_cli_options(
+            cli_path=self.cli_path,
+            cli_url=self.cli_url,
+            use_stdio=self.use_stdio,
+            log_level=self.log_level,
+        )
+
+        options: dict[str, Any] = {"log_level": log_level}
+        env = _copilot_client_env(auth)
+        if env is not None:
+            options["env"] = env
         if cli_url:
             options["cli_url"] = cli_url
         else:
@@ -467,8 +611,80 @@ class ChatCopilot(BaseChatModel):
                 options["cli_path"] = cli_path
             if use_stdio is not None:
                 options["use_stdio"] = use_stdio
+        return options
+
+    def _reset_client_state(self) -> None:
+        # model_copy() shares private attributes; copies start without a client.
+        self._client = None
+        self._client_key = None
+        self._client_loop = None
+        self._client_lock = None
+        self._client_finalizer = None
+
+    async def _get_client(self, auth: CopilotAuth | None) -> CopilotClient:
+        """Return a started CopilotClient, reusing the cached one when possible."""
+        client_cls = _load_copilot_sdk().client_cls
+        if client_cls is None:
+            raise ImportError(
+                "github-copilot-sdk is required for ChatCopilot transport='sdk'. "
+                "Use transport='direct' or install github-copilot-sdk."
+            )
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            # Clients and locks are bound to the loop that created them.
+            self._detach_client()
+            self._client_loop = loop
+            self._client_lock = asyncio.Lock()
+        assert self._client_lock is not None
+        options = self._client_options(auth)
+        token = auth.access_token if auth else ""
+        key = (
+            options.get("cli_url"),
+            options.get("cli_path"),
+            options.get("use_stdio"),
+            options["log_level"],
+            hashlib.sha256(token.encode("utf-8"), usedforsecurity=False).digest(),
+            auth.enterprise_url if auth else None,
+        )
+        async with self._client_lock:
+            if self._client is not None and self._client_key == key:
+                return self._client
+            await self._stop_client()
+            client = client_cls(options)
+            await client.start()
+            self._client = client
+            self._client_key = key
+            self._client_finalizer = weakref.finalize(self, _stop_client_soon, client, loop)
+            return client
+
+    def _detach_client(self) -> None:
+        if self._client_finalizer is not None:
+            # Hand the old client to its own loop for shutdown, if still open.
+            self._client_finalizer()
+        self._client = None
+        self._client_key = None
+        self._client_finalizer = None
+
+    async def _stop_client(self) -> None:
+        client = self._client
+        if self._client_finalizer is not None:
+            self._client_finalizer.detach()
+        self._client = None
+        self._client_key = None
+        self._client_finalizer = None
+        if client is not None:
+            try:
+                await client.stop()
+            except Exception:
+                pass
 
-        return CopilotClient(options)
+    async def aclose(self) -> None:
+        """Stop the cached Copilot SDK client, if one was started."""
+        if self._client_loop is asyncio.get_running_loop() and self._client_lock is not None:
+            async with self._client_lock:
+                await self._stop_client()
+        else:
+            self._detach_client()
 
     def _direct_base_url(self, auth: CopilotAuth | None) -> str:
         return (self.api_base or _copilot_api_base(auth.enterprise_url if auth else None)).rstrip("/")
@@ -655,8 +871,7 @@ class ChatCopilot(BaseChatModel):
         tool_calls: Sequence[dict[str, Any]],
     ) -> tuple[list[ToolMessage], list[dict[str, Any]]]:
         tools_by_name = {str(getattr(tool, "name", "") or "").strip(): tool for tool in self._tools}
-        tool_messages: list[ToolMessage] = []
-        handled: list[dict[str, Any]] = []
+        calls: list[tuple[Any, str, str, dict[str, Any]]] = []
         for tool_call in tool_calls:
             tool_name = str(tool_call.get("name") or "").strip()
             call_id = str(tool_call.get("id") or tool_call.get("call_id") or "").strip()
@@ -666,14 +881,20 @@ class ChatCopilot(BaseChatModel):
             tool = tools_by_name.get(tool_name)
             if tool is None or not callable(getattr(tool, "handler", None)):
                 raise RuntimeError(f"Copilot auto_execute_tools missing bound implementation for '{tool_name}'")
+            calls.append((tool, call_id, tool_name, args))
 
-            success = True
+        async def _run(tool: Any, call_id: str, tool_name: str, args: dict[str, Any]) -> tuple[Any, bool]:
             try:
-                result = await tool.handler({"id": call_id, "name": tool_name, "arguments": args})
+                return await tool.handler({"id": call_id, "name": tool_name, "arguments": args}), True
             except Exception as exc:
-                success = False
-                result = _normalize_tool_result({"error": str(exc)})
+                return _normalize_tool_result({"error": str(exc)}), False
+
+        # Tool calls from one assistant turn are independent; run them concurrently.
+        outcomes = await asyncio.gather(*(_run(*call) for call in calls))
 
+        tool_messages: list[ToolMessage] = []
+        handled: list[dict[str, Any]] = []
+        for (_, call_id, tool_name, args), (result, success) in zip(calls, outcomes):
             result_text = self._tool_result_text(result)
             tool_messages.append(ToolMessage(content=result_text, tool_call_id=call_id))
             handled.append(
@@ -1071,10 +1292,9 @@ class ChatCopilot(BaseChatModel):
         auth = await self._ensure_auth()
         prompt, system_message = self._build_prompt(messages)
 
-        client = self._build_client(auth)
         session = None
         try:
-            await client.start()
+            client = await self._get_client(auth)
             session_config: dict[str, Any] = {"model": self.model}
             if system_message:
                 session_config["system_message"] = {"mode": "append", "content": system_message}
@@ -1105,10 +1325,6 @@ class ChatCopilot(BaseChatModel):
                     await session.destroy()
                 except Exception:
                     pass
-            try:
-                await client.stop()
-            except Exception:
-                pass
 
     def _generate(
         self,
@@ -1117,9 +1333,7 @@ class ChatCopilot(BaseChatModel):
         run_manager: CallbackManagerForLLMRun | None = None,
         **kwargs: Any,
     ) -> ChatResult:
-        return asyncio.get_event_loop().run_until_complete(
-            self._agenerate(messages, stop, None, **kwargs)
-        )
+        return _run_sync(self._agenerate(messages, stop, None, **kwargs))
 
     async def _astream(
         self,
@@ -1139,26 +1353,33 @@ class ChatCopilot(BaseChatModel):
         auth = await self._ensure_auth()
         prompt, system_message = self._build_prompt(messages)
 
-        client = self._build_client(auth)
         session = None
-        queue: asyncio.Queue[tuple[str, str | None]] = asyncio.Queue()
+        # SDK events may arrive on another thread. Buffer them and wake the
+        # loop only once per batch instead of once per token.
+        pending: list[tuple[str, str | None]] = []
+        pending_lock = threading.Lock()
+        wake_scheduled = False
+        wake = asyncio.Event()
         loop = asyncio.get_running_loop()
+        stream_events = _load_copilot_sdk().stream_events
 
         def _enqueue(event_type: str, payload: str | None) -> None:
-            loop.call_soon_threadsafe(queue.put_nowait, (event_type, payload))
+            nonlocal wake_scheduled
+            with pending_lock:
+                pending.append((event_type, payload))
+                if wake_scheduled:
+                    return
+                wake_scheduled = True
+            loop.call_soon_threadsafe(wake.set)
 
         def _handler(event: SessionEvent) -> None:
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                _enqueue("delta", _coerce_text(event.data.delta_content))
-            elif event.type == SessionEventType.ASSISTANT_MESSAGE:
-                _enqueue("final", _coerce_text(event.data.content))
-            elif event.type == SessionEventType.SESSION_ERROR:
-                _enqueue("error", getattr(event.data, "message", "Copilot session error"))
-            elif event.type == SessionEventType.SESSION_IDLE:
-                _enqueue("done", None)
+            handled = stream_events.get(event.type)
+            if handled is not None:
+                event_type, extract = handled
+                _enqueue(event_type, extract(event.data))
 
         try:
-            await client.start()
+            client = await self._get_client(auth)
             session_config: dict[str, Any] = {"model": self.model, "streaming": True}
             if system_message:
                 session_config["system_message"] = {"mode": "append", "content": system_message}
@@ -1169,22 +1390,33 @@ class ChatCopilot(BaseChatModel):
             session.on(_handler)
             await session.send({"prompt": prompt})
 
-            while True:
-                event_type, payload = await queue.get()
-                if event_type == "delta" and payload:
-                    chunk = AIMessageChunk(content=payload)
-                    yield ChatGenerationChunk(message=chunk)
-                elif event_type == "error":
-                    raise RuntimeError(payload or "Copilot session error")
-                elif event_type == "done":
-                    break
+            done = False
+            while not done:
+                await wake.wait()
+                wake.clear()
+                with pending_lock:
+                    batch = pending[:]
+                    pending.clear()
+                    wake_scheduled = False
+
+                deltas: list[str] = []
+                error: str | None = None
+                for event_type, payload in batch:
+                    if event_type == "delta" and payload:
+                        deltas.append(payload)
+                    elif event_type == "error":
+                        error = payload or "Copilot session error"
+                        break
+                    elif event_type == "done":
+                        done = True
+                        break
+                if deltas:
+                    yield ChatGenerationChunk(message=AIMessageChunk(content="".join(deltas)))
+                if error is not None:
+                    raise RuntimeError(error)
         finally:
             if session:
                 try:
                     await session.destroy()
                 except Exception:
                     pass
-            try:
-                await client.stop()
-            except Exception:
-                pass
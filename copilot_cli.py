@@ -21,13 +21,17 @@ from .copilot_auth import (
     remove_copilot_account,
     verify_copilot_token,
     get_copilot_accounts_path,
+    aclose_copilot_http_client,
 )
 
 
 def cmd_login(args):
     """Login with GitHub Copilot account."""
     async def do_login():
-        await copilot_interactive_login(enterprise_url=args.enterprise_url)
+        try:
+            await copilot_interactive_login(enterprise_url=args.enterprise_url)
+        finally:
+            await aclose_copilot_http_client()
 
     try:
         asyncio.run(do_login())
@@ -103,6 +107,8 @@ def cmd_status(args):
         except Exception as e:
             print(f"Token:   Invalid ({e})")
             return False
+        finally:
+            await aclose_copilot_http_client()
 
     if asyncio.run(check_token()):
         print("\nReady to use with ChatCopilot!")
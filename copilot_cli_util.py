@@ -0,0 +1,114 @@
+"""Shared helpers for the Copilot chat model and model listing."""
+
+from __future__ import annotations
+
+import functools
+import os
+import shutil
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .copilot_auth import CopilotAuth
+
+
+def _coerce_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        parts: list[str] = []
+        append = parts.append
+        for item in value:
+            if isinstance(item, str):
+                append(item)
+            elif isinstance(item, dict):
+                text = item.get("text") or item.get("content")
+                if text:
+                    append(str(text))
+        if len(parts) == 1:
+            return parts[0].strip()
+        return "\n".join(parts).strip()
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _resolve_cli_options(
+    *,
+    cli_path: str | None = None,
+    cli_url: str | None = None,
+    use_stdio: bool | None = None,
+    log_level: str | None = None,
+) -> tuple[str | None, str | None, bool | None, str]:
+    environ = os.environ
+    return _resolve_env_options(
+        cli_path or environ.get("COPILOT_CLI_PATH"),
+        cli_url or environ.get("COPILOT_CLI_URL"),
+        use_stdio,
+        environ.get("COPILOT_USE_STDIO") if use_stdio is None else None,
+        log_level or environ.get("COPILOT_LOG_LEVEL"),
+        environ.get("PATH", ""),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_env_options(
+    cli_path: str | None,
+    cli_url: str | None,
+    use_stdio: bool | None,
+    use_stdio_env: str | None,
+    log_level: str | None,
+    path_env: str,
+) -> tuple[str | None, str | None, bool | None, str]:
+    # Arguments already have environment fallbacks applied (path_env keys the
+    # PATH lookup), so this is pure and safe to memoize.
+    if use_stdio is None:
+        env_value = (use_stdio_env or "").strip().lower()
+        if env_value:
+            use_stdio = env_value in {"1", "true", "yes", "on"}
+    return cli_url, _resolve_cli_path(cli_path), use_stdio, log_level or "info"
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_which(name: str, path_env: str) -> str | None:
+    # path_env is part of the key so a changed PATH triggers a fresh lookup.
+    return shutil.which(name, path=path_env or None)
+
+
+def _which(name: str) -> str | None:
+    return _cached_which(name, os.environ.get("PATH", ""))
+
+
+def _resolve_cli_path(configured_path: str | None) -> str | None:
+    """Resolve Copilot CLI path to an absolute executable path when possible.
+
+    The Copilot SDK validates cli_path using os.path.exists, so PATH-only values
+    like "copilot" must be converted via shutil.which.
+    """
+    raw = (configured_path or "").strip()
+    if raw:
+        expanded = os.path.expanduser(raw)
+        if any(sep in expanded for sep in ("/", "\\")):
+            return expanded
+        located = _which(expanded)
+        return located or expanded
+    # Unset: try PATH command first, then allow SDK bundled binary fallback.
+    return _which("copilot")
+
+
+def _copilot_client_env(auth: CopilotAuth | None) -> dict[str, str] | None:
+    """Environment for the Copilot CLI process, with credentials overlaid.
+
+    The SDK replaces the child environment wholesale when ``env`` is given and
+    inherits os.environ when it is omitted, so None is returned when there is
+    nothing to add. Otherwise the live os.environ is copied on every call so
+    both paths see in-process environment changes.
+    """
+    overlay: dict[str, str] = {}
+    if auth and auth.access_token:
+        overlay["GH_TOKEN"] = auth.access_token
+        overlay["GITHUB_TOKEN"] = auth.access_token
+    if auth and auth.enterprise_url:
+        overlay["COPILOT_DOMAIN"] = auth.enterprise_url
+    if not overlay:
+        return None
+    return {**os.environ, **overlay}
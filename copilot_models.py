@@ -4,10 +4,11 @@ Helper utilities for listing Copilot models via the Copilot CLI SDK.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
 import re
-import shutil
-from typing import Any
+from typing import Any, Iterable, Iterator
 from urllib.parse import urlparse
 
 import httpx
@@ -16,8 +17,14 @@ import httpx
 
 try:
     from .copilot_auth import CopilotAuth
+    from .copilot_cli_util import _coerce_text, _copilot_client_env, _resolve_cli_options
 except Exception:  # pragma: no cover
     from copilot_auth import CopilotAuth  # type: ignore
+    from copilot_cli_util import (  # type: ignore
+        _coerce_text,
+        _copilot_client_env,
+        _resolve_cli_options,
+    )
 
 
 DEFAULT_COPILOT_MODELS = [
@@ -125,25 +132,12 @@ async def fetch_copilot_api_models(
     return models
 
 _MODEL_TOKEN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]+")
+_BACKTICK_RE = re.compile(r"`([^`]+)`")
 _MODEL_STOPWORDS = {"model", "models", "available", "current", "default"}
-
-
-def _coerce_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            if isinstance(item, str):
-                parts.append(item)
-            elif isinstance(item, dict):
-                text = item.get("text") or item.get("content")
-                if text:
-                    parts.append(str(text))
-        return "\n".join(parts).strip()
-    if value is None:
-        return ""
-    return str(value)
+# IDs already known to pass _looks_like_model_id: the defaults plus IDs seen in
+# earlier replies (bounded), so common tokens skip the regex and char scans.
+_KNOWN_MODEL_IDS: set[str] = {model["id"] for model in DEFAULT_COPILOT_MODELS}
+_KNOWN_MODEL_IDS_MAX = 512
 
 
 def _looks_like_model_id(token: str) -> bool:
@@ -151,7 +145,7 @@ def _looks_like_model_id(token: str) -> bool:
         return False
     if token.lower() in _MODEL_STOPWORDS:
         return False
-    if not re.match(r"^[A-Za-z0-9][A-Za-z0-9._-]+$", token):
+    if not _MODEL_TOKEN_RE.fullmatch(token):
         return False
     if not any(ch.isalpha() for ch in token):
         return False
@@ -163,41 +157,51 @@ def _looks_like_model_id(token: str) -> bool:
 def parse_copilot_models(text: str) -> list[str]:
     if not text:
         return []
+    return list(_parse_copilot_models(text))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_copilot_models(text: str) -> tuple[str, ...]:
+    # The /model reply rarely changes between calls, so parses are memoized.
+    # The three candidate sources are kept separate (rather than one combined
+    # alternation) because their order decides which IDs are listed first.
+    candidates = itertools.chain(
+        # Prefer explicit model IDs shown in backticks.
+        _BACKTICK_RE.findall(text),
+        # Then parse bullet-list style output.
+        _iter_bullet_items(text),
+        # Fallback: free-form token scan.
+        _MODEL_TOKEN_RE.findall(text),
+    )
+    # dict.fromkeys keeps the first occurrence of each ID, in order.
+    return tuple(dict.fromkeys(_iter_model_ids(candidates)))
 
-    candidates: list[str] = []
-
-    # Prefer explicit model IDs shown in backticks.
-    candidates.extend(re.findall(r"`([^`]+)`", text))
 
-    # Then parse bullet-list style output.
+def _iter_bullet_items(text: str) -> Iterator[str]:
     for raw_line in text.splitlines():
         line = raw_line.strip()
-        if line.startswith("- "):
-            candidates.append(line[2:].strip())
-        elif line.startswith("* "):
-            candidates.append(line[2:].strip())
+        if line.startswith(("- ", "* ")):
+            yield line[2:].strip()
 
-    # Fallback: free-form token scan.
-    candidates.extend(_MODEL_TOKEN_RE.findall(text))
 
-    results: list[str] = []
-    seen: set[str] = set()
+_MODEL_TOKEN_PUNCTUATION = "`'\"()[]{}.,;:"
+
+
+def _iter_model_ids(candidates: Iterable[str]) -> Iterator[str]:
+    known = _KNOWN_MODEL_IDS
     for token in candidates:
-        normalized = str(token or "").strip().strip("`'\"()[]{}.,;:")
-        if not normalized:
-            continue
+        normalized = token.strip().strip(_MODEL_TOKEN_PUNCTUATION)
         # Bullet lines can include trailing descriptions.
         if " " in normalized:
             normalized = normalized.split()[0]
         if not normalized:
             continue
-        if not _looks_like_model_id(normalized):
-            continue
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        results.append(normalized)
-    return results
+        if normalized not in known:
+            if not _looks_like_model_id(normalized):
+                continue
+            if len(known) < _KNOWN_MODEL_IDS_MAX:
+                known.add(normalized)
+        yield normalized
 
 
 def model_id_to_name(model_id: str) -> str:
@@ -230,38 +234,6 @@ def model_id_to_name(model_id: str) -> str:
     return f"{head} {' '.join(tail_parts)}".strip()
 
 
-def _resolve_cli_options(
-    *,
-    cli_path: str | None = None,
-    cli_url: str | None = None,
-    use_stdio: bool | None = None,
-    log_level: str | None = None,
-) -> tuple[str | None, str | None, bool | None, str]:
-    resolved_cli_url = cli_url or os.environ.get("COPILOT_CLI_URL")
-    resolved_cli_path = _resolve_cli_path(cli_path or os.environ.get("COPILOT_CLI_PATH"))
-
-    resolved_use_stdio = use_stdio
-    if resolved_use_stdio is None:
-        env_value = (os.environ.get("COPILOT_USE_STDIO") or "").strip().lower()
-        if env_value:
-            resolved_use_stdio = env_value in {"1", "true", "yes", "on"}
-
-    resolved_log_level = log_level or os.environ.get("COPILOT_LOG_LEVEL") or "info"
-    return resolved_cli_url, resolved_cli_path, resolved_use_stdio, resolved_log_level
-
-
-def _resolve_cli_path(configured_path: str | None) -> str | None:
-    raw = (configured_path or "").strip()
-    if raw:
-        expanded = os.path.expanduser(raw)
-        if any(sep in expanded for sep in ("/", "\\")):
-            return expanded
-        located = shutil.which(expanded)
-        return located or expanded
-    # Unset: try PATH command first, then allow SDK bundled binary fallback.
-    return shutil.which("copilot")
-
-
 def _cli_exists(cli_path: str | None) -> bool:
     if not cli_path:
         return False
@@ -384,14 +356,10 @@ async def fetch_copilot_models(
     if not resolved_cli_url and resolved_cli_path and not _cli_exists(resolved_cli_path):
         raise FileNotFoundError(f"Copilot CLI not found: {resolved_cli_path}")
 
-    env = os.environ.copy()
-    if auth and auth.access_token:
-        env["GH_TOKEN"] = auth.access_token
-        env["GITHUB_TOKEN"] = auth.access_token
-    if auth and auth.enterprise_url:
-        env["COPILOT_DOMAIN"] = auth.enterprise_url
-
-    options: dict[str, Any] = {"log_level": resolved_log_level, "env": env}
+    options: dict[str, Any] = {"log_level": resolved_log_level}
+    env = _copilot_client_env(auth)
+    if env is not None:
+        options["env"] = env
     if resolved_cli_url:
         options["cli_url"] = resolved_cli_url
     else:
@@ -1,162 +1,249 @@
 """Shared provider metadata and model catalogs.
 
 This module is the single source of truth for provider display metadata and
-default model catalogs used by the orchestration API layer.
+default model catalogs used by the orchestration API layer. Catalogs are
+frozen (read-only mappings and tuples of ``CatalogModel`` entries), so getters
+return the shared objects without copying; pass them through
+``catalog_to_jsonable`` at the JSON serialization boundary.
 """
 
 from __future__ import annotations
 
-from copy import deepcopy
+import functools
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class CatalogModel(NamedTuple):
+    """A single model catalog entry."""
+
+    id: str
+    name: str
+    description: str = ""
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the JSON-ready form (``description`` only when set)."""
+        if self.description:
+            return {"id": self.id, "name": self.name, "description": self.description}
+        return {"id": self.id, "name": self.name}
+
+
+def _model(model_id: str, name: str, description: str = "") -> CatalogModel:
+    """Build a catalog entry with interned string fields."""
+    return CatalogModel(sys.intern(model_id), sys.intern(name), sys.intern(description))
+
 
 # Shared provider display metadata for UI/status endpoints.
-OAUTH_PROVIDER_METADATA = {
-    "antigravity": {"name": "Antigravity (Google)", "type": "oauth"},
-    "codex": {"name": "Codex (OpenAI)", "type": "oauth"},
-    "copilot": {"name": "GitHub Copilot", "type": "oauth"},
-}
+OAUTH_PROVIDER_METADATA = _freeze(
+    {
+        "antigravity": {"name": "Antigravity (Google)", "type": "oauth"},
+        "codex": {"name": "Codex (OpenAI)", "type": "oauth"},
+        "copilot": {"name": "GitHub Copilot", "type": "oauth"},
+    }
+)
 
 # Detailed model catalogs for provider `/models` endpoints.
-ANTIGRAVITY_ROUTE_MODELS = {
-    "gemini": [
-        {
-            "id": "antigravity-gemini-3-flash",
-            "name": "Gemini 3 Flash",
-            "description": "Fast, efficient model with thinking",
-        },
-        {
-            "id": "antigravity-gemini-3-pro-low",
-            "name": "Gemini 3 Pro (Low)",
-            "description": "Pro model with low thinking budget",
-        },
-        {
-            "id": "antigravity-gemini-3-pro-high",
-            "name": "Gemini 3 Pro (High)",
-            "description": "Pro model with high thinking budget",
-        },
-    ],
-    "claude": [
-        {
-            "id": "antigravity-claude-sonnet-4-6",
-            "name": "Claude Sonnet 4.6",
-            "description": "Claude Sonnet 4.6",
-        },
-        {
-            "id": "antigravity-claude-opus-4-6-thinking-low",
-            "name": "Claude Opus 4.6 (Thinking Low)",
-            "description": "8K thinking budget",
-        },
-        {
-            "id": "antigravity-claude-opus-4-6-thinking-max",
-            "name": "Claude Opus 4.6 (Thinking Max)",
-            "description": "32K thinking budget",
-        },
-    ],
+ANTIGRAVITY_ROUTE_MODELS: Mapping[str, tuple[CatalogModel, ...]] = MappingProxyType(
+    {
+        "gemini": (
+            _model(
+                "antigravity-gemini-3-flash",
+                "Gemini 3 Flash",
+                "Fast, efficient model with thinking",
+            ),
+            _model(
+                "antigravity-gemini-3-pro-low",
+                "Gemini 3 Pro (Low)",
+                "Pro model with low thinking budget",
+            ),
+            _model(
+                "antigravity-gemini-3-pro-high",
+                "Gemini 3 Pro (High)",
+                "Pro model with high thinking budget",
+            ),
+        ),
+        "claude": (
+            _model(
+                "antigravity-claude-sonnet-4-6",
+                "Claude Sonnet 4.6",
+                "Claude Sonnet 4.6",
+            ),
+            _model(
+                "antigravity-claude-opus-4-6-thinking-low",
+                "Claude Opus 4.6 (Thinking Low)",
+                "8K thinking budget",
+            ),
+            _model(
+                "antigravity-claude-opus-4-6-thinking-max",
+                "Claude Opus 4.6 (Thinking Max)",
+                "32K thinking budget",
+            ),
+        ),
+    }
+)
+
+CODEX_ROUTE_MODELS: Mapping[str, tuple[CatalogModel, ...]] = MappingProxyType(
+    {
+        "gpt5": (
+            _model(
+                "gpt-5.4",
+                "GPT-5.4",
+                "GPT-5.4 base model retained by Codex OAuth flow",
+            ),
+            _model(
+                "gpt-5.4-mini",
+                "GPT-5.4 Mini",
+                "Smaller GPT-5.4 Codex-compatible model",
+            ),
+            _model("gpt-5.3-codex", "GPT-5.3 Codex", "Latest GPT-5 Codex model"),
+            _model(
+                "gpt-5.3-codex-spark",
+                "GPT-5.3 Codex Spark",
+                "Fast GPT-5.3 Codex variant",
+            ),
+            _model("gpt-5-codex", "GPT-5 Codex", "GPT-5 Codex family model"),
+            _model("gpt-5.2-codex", "GPT-5.2 Codex", "GPT-5.2 optimized for code"),
+            _model("gpt-5.1-codex", "GPT-5.1 Codex", "GPT-5.1 optimized for code"),
+            _model(
+                "gpt-5.1-codex-max",
+                "GPT-5.1 Codex Max",
+                "GPT-5.1 Codex with max capabilities",
+            ),
+            _model(
+                "gpt-5.1-codex-mini",
+                "GPT-5.1 Codex Mini",
+                "Lightweight GPT-5.1 Codex",
+            ),
+            _model(
+                "codex-mini-latest",
+                "Codex Mini Latest",
+                "Alias for the latest Codex Mini model",
+            ),
+            _model(
+                "gpt-5.2",
+                "GPT-5.2",
+                "GPT-5 base model retained by Codex OAuth flow",
+            ),
+        ),
+    }
+)
+
+# Compact model catalogs for provider status views. These are derived from the
+# route catalogs on first access (see __getattr__ below); Antigravity's view is
+# a curated subset with a shorter display name for the max-thinking Opus tier.
+_ANTIGRAVITY_PROFILE_IDS = (
+    "antigravity-gemini-3-flash",
+    "antigravity-gemini-3-pro-low",
+    "antigravity-gemini-3-pro-high",
+    "antigravity-claude-sonnet-4-6",
+    "antigravity-claude-opus-4-6-thinking-max",
+)
+_ANTIGRAVITY_PROFILE_NAMES = {
+    "antigravity-claude-opus-4-6-thinking-max": "Claude Opus 4.6 (Thinking)",
 }
 
-CODEX_ROUTE_MODELS = {
-    "gpt5": [
-        {
-            "id": "gpt-5.4",
-            "name": "GPT-5.4",
-            "description": "GPT-5.4 base model retained by Codex OAuth flow",
-        },
-        {
-            "id": "gpt-5.4-mini",
-            "name": "GPT-5.4 Mini",
-            "description": "Smaller GPT-5.4 Codex-compatible model",
-        },
-        {
-            "id": "gpt-5.3-codex",
-            "name": "GPT-5.3 Codex",
-            "description": "Latest GPT-5 Codex model",
-        },
-        {
-            "id": "gpt-5.3-codex-spark",
-            "name": "GPT-5.3 Codex Spark",
-            "description": "Fast GPT-5.3 Codex variant",
-        },
-        {
-            "id": "gpt-5-codex",
-            "name": "GPT-5 Codex",
-            "description": "GPT-5 Codex family model",
-        },
-        {
-            "id": "gpt-5.2-codex",
-            "name": "GPT-5.2 Codex",
-            "description": "GPT-5.2 optimized for code",
-        },
-        {
-            "id": "gpt-5.1-codex",
-            "name": "GPT-5.1 Codex",
-            "description": "GPT-5.1 optimized for code",
-        },
-        {
-            "id": "gpt-5.1-codex-max",
-            "name": "GPT-5.1 Codex Max",
-            "description": "GPT-5.1 Codex with max capabilities",
-        },
-        {
-            "id": "gpt-5.1-codex-mini",
-            "name": "GPT-5.1 Codex Mini",
-            "description": "Lightweight GPT-5.1 Codex",
-        },
-        {
-            "id": "codex-mini-latest",
-            "name": "Codex Mini Latest",
-            "description": "Alias for the latest Codex Mini model",
-        },
-        {
-            "id": "gpt-5.2",
-            "name": "GPT-5.2",
-            "description": "GPT-5 base model retained by Codex OAuth flow",
-        },
-    ],
+
+def _profile_view(
+    route_models: Mapping[str, tuple[CatalogModel, ...]],
+    model_ids: tuple[str, ...] | None = None,
+    names: Mapping[str, str] | None = None,
+) -> tuple[CatalogModel, ...]:
+    """Project route catalog entries down to compact ``id``/``name`` entries."""
+    entries = {model.id: model for group in route_models.values() for model in group}
+    names = names or {}
+    return tuple(
+        _model(model_id, names.get(model_id, entries[model_id].name))
+        for model_id in (entries if model_ids is None else model_ids)
+    )
+
+
+@functools.cache
+def _antigravity_profile_models() -> tuple[CatalogModel, ...]:
+    return _profile_view(
+        ANTIGRAVITY_ROUTE_MODELS, _ANTIGRAVITY_PROFILE_IDS, _ANTIGRAVITY_PROFILE_NAMES
+    )
+
+
+@functools.cache
+def _codex_profile_models() -> tuple[CatalogModel, ...]:
+    return _profile_view(CODEX_ROUTE_MODELS)
+
+
+_LAZY_PROFILE_MODELS = {
+    "ANTIGRAVITY_PROFILE_MODELS": _antigravity_profile_models,
+    "CODEX_PROFILE_MODELS": _codex_profile_models,
 }
 
-# Compact model catalogs for provider status views.
-ANTIGRAVITY_PROFILE_MODELS = [
-    {"id": "antigravity-gemini-3-flash", "name": "Gemini 3 Flash"},
-    {"id": "antigravity-gemini-3-pro-low", "name": "Gemini 3 Pro (Low)"},
-    {"id": "antigravity-gemini-3-pro-high", "name": "Gemini 3 Pro (High)"},
-    {"id": "antigravity-claude-sonnet-4-6", "name": "Claude Sonnet 4.6"},
-    {"id": "antigravity-claude-opus-4-6-thinking-max", "name": "Claude Opus 4.6 (Thinking)"},
-]
 
-CODEX_PROFILE_MODELS = [
-    {"id": "gpt-5.4", "name": "GPT-5.4"},
-    {"id": "gpt-5.4-mini", "name": "GPT-5.4 Mini"},
-    {"id": "gpt-5.3-codex", "name": "GPT-5.3 Codex"},
-    {"id": "gpt-5.3-codex-spark", "name": "GPT-5.3 Codex Spark"},
-    {"id": "gpt-5-codex", "name": "GPT-5 Codex"},
-    {"id": "gpt-5.2-codex", "name": "GPT-5.2 Codex"},
-    {"id": "gpt-5.1-codex", "name": "GPT-5.1 Codex"},
-    {"id": "gpt-5.1-codex-max", "name": "GPT-5.1 Codex Max"},
-    {"id": "gpt-5.1-codex-mini", "name": "GPT-5.1 Codex Mini"},
-    {"id": "codex-mini-latest", "name": "Codex Mini Latest"},
-    {"id": "gpt-5.2", "name": "GPT-5.2"},
-]
+def __getattr__(name: str) -> tuple[CatalogModel, ...]:
+    builder = _LAZY_PROFILE_MODELS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
+
+
+def catalog_to_jsonable(value: Any) -> Any:
+    """Convert a frozen catalog into plain JSON-ready dicts and lists.
+
+    ``CatalogModel`` entries become ``{"id", "name"[, "description"]}`` dicts
+    rather than the positional lists ``json.dumps`` would emit for a tuple.
+    """
+    if isinstance(value, CatalogModel):
+        return value.to_dict()
+    if isinstance(value, Mapping):
+        return {key: catalog_to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [catalog_to_jsonable(item) for item in value]
+    return value
+
+
+def get_provider_metadata() -> Mapping[str, Mapping[str, str]]:
+    """Return provider display metadata (read-only, shared).
+
+    The result is a ``MappingProxyType``, which ``json.dumps`` rejects; use
+    ``catalog_to_jsonable`` to get plain dicts.
+    """
+    return OAUTH_PROVIDER_METADATA
+
+
+def get_antigravity_route_models() -> Mapping[str, tuple[CatalogModel, ...]]:
+    """Return Antigravity `/models` catalog (read-only, shared).
 
+    Use ``catalog_to_jsonable`` before ``json.dumps``.
+    """
+    return ANTIGRAVITY_ROUTE_MODELS
 
-def get_provider_metadata() -> dict[str, dict[str, str]]:
-    """Return provider display metadata (deep copy)."""
-    return deepcopy(OAUTH_PROVIDER_METADATA)
 
+def get_codex_route_models() -> Mapping[str, tuple[CatalogModel, ...]]:
+    """Return Codex `/models` catalog (read-only, shared).
 
-def get_antigravity_route_models() -> dict[str, list[dict[str, str]]]:
-    """Return Antigravity `/models` catalog (deep copy)."""
-    return deepcopy(ANTIGRAVITY_ROUTE_MODELS)
+    Use ``catalog_to_jsonable`` before ``json.dumps``.
+    """
+    return CODEX_ROUTE_MODELS
 
 
-def get_codex_route_models() -> dict[str, list[dict[str, str]]]:
-    """Return Codex `/models` catalog (deep copy)."""
-    return deepcopy(CODEX_ROUTE_MODELS)
+def get_antigravity_profile_models() -> tuple[CatalogModel, ...]:
+    """Return Antigravity compact profile model list (read-only, shared).
 
+    Entries are ``CatalogModel`` tuples; use ``catalog_to_jsonable`` to get dicts.
+    """
+    return _antigravity_profile_models()
 
-def get_antigravity_profile_models() -> list[dict[str, str]]:
-    """Return Antigravity compact profile model list (deep copy)."""
-    return deepcopy(ANTIGRAVITY_PROFILE_MODELS)
 
+def get_codex_profile_models() -> tuple[CatalogModel, ...]:
+    """Return Codex compact profile model list (read-only, shared).
 
-def get_codex_profile_models() -> list[dict[str, str]]:
-    """Return Codex compact profile model list (deep copy)."""
-    return deepcopy(CODEX_PROFILE_MODELS)
+    Entries are ``CatalogModel`` tuples; use ``catalog_to_jsonable`` to get dicts.
+    """
+    return _codex_profile_models()
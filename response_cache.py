@@ -0,0 +1,81 @@
+"""On-disk response cache for repeated chat model calls (used by the test scripts)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from langchain_core.messages import AIMessage
+
+
+def _cache_dir() -> Path:
+    return Path.home() / ".cache" / "llm-provider-auth"
+
+
+def _cache_key(model: str, messages: Any, key_extra: Iterable[Any]) -> str:
+    payload = json.dumps([model, messages, list(key_extra)], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp_path = path.with_suffix(f"{path.suffix}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_cached(path: Path, ttl: float) -> AIMessage | None:
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return AIMessage(
+            content=data["content"],
+            tool_calls=data.get("tool_calls") or [],
+            usage_metadata=data.get("usage_metadata"),
+        )
+    except Exception:
+        return None
+
+
+async def cached_ainvoke(
+    chat: Any,
+    messages: Any,
+    *,
+    ttl: float = 3600,
+    key_extra: Iterable[Any] = (),
+) -> AIMessage:
+    """`chat.ainvoke(messages)`, served from disk if the same call ran within `ttl` seconds.
+
+    The key covers the model name, the messages and `key_extra` (e.g. bound
+    tools); only content, tool calls and usage survive the round trip.
+    """
+    path = _cache_dir() / f"{_cache_key(chat.model, messages, key_extra)}.json"
+    cached = _read_cached(path, ttl)
+    if cached is not None:
+        return cached
+
+    response = await chat.ainvoke(messages)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(
+            path,
+            json.dumps(
+                {
+                    "content": response.content,
+                    "tool_calls": response.tool_calls,
+                    "usage_metadata": response.usage_metadata,
+                }
+            ),
+        )
+    except OSError:
+        # Caching is best-effort; a read-only home shouldn't fail the call.
+        pass
+    return response
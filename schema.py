@@ -18,284 +18,267 @@ except ImportError:  # pragma: no cover
     )
 
 # Unsupported constraint keywords that should be moved to description hints
-UNSUPPORTED_CONSTRAINTS = [
+UNSUPPORTED_CONSTRAINTS = frozenset({
     "minLength", "maxLength", "exclusiveMinimum", "exclusiveMaximum",
     "pattern", "minItems", "maxItems", "format",
     "default", "examples",
-]
+})
 
 # Keywords that should be removed after hint extraction
-UNSUPPORTED_KEYWORDS = [
-    *UNSUPPORTED_CONSTRAINTS,
+UNSUPPORTED_KEYWORDS = UNSUPPORTED_CONSTRAINTS | {
     "$schema", "$defs", "definitions", "const", "$ref", "additionalProperties",
     "propertyNames", "title", "$id", "$comment",
-]
+}
+
+
+# Terminal schemas such as {"type": "string", "description": ...} have nothing
+# for any pass to rewrite, so the walker copies them without further work.
+_LEAF_KEYS = frozenset({"type", "description"})
+_SCALAR_TYPES = frozenset({"string", "integer", "number", "boolean", "null"})
+
+
+def _is_scalar_leaf(schema: dict[str, Any]) -> bool:
+    """Check whether schema is a scalar-typed leaf with only type/description."""
+    schema_type = schema.get("type")
+    return (
+        isinstance(schema_type, str)
+        and schema_type in _SCALAR_TYPES
+        and schema.keys() <= _LEAF_KEYS
+    )
 
 
 def append_description_hint(schema: dict[str, Any], hint: str) -> dict[str, Any]:
     """Appends a hint to a schema's description field."""
     if not isinstance(schema, dict):
         return schema
+    result = {**schema}
+    _append_description_hint_in_place(result, hint)
+    return result
+
+
+def _append_description_hint_in_place(schema: dict[str, Any], hint: str) -> None:
+    """Append a hint to the description of a dict the caller owns."""
     existing = schema.get("description", "")
-    new_description = f"{existing} ({hint})" if existing else hint
-    return {**schema, "description": new_description}
+    schema["description"] = f"{existing} ({hint})" if existing else hint
 
 
-def convert_refs_to_hints(schema: Any) -> Any:
-    """Convert $ref to description hints."""
-    if not isinstance(schema, dict):
-        return schema
-    
-    if isinstance(schema, list):
-        return [convert_refs_to_hints(item) for item in schema]
-    
-    # If this object has $ref, replace it with a hint
-    if "$ref" in schema:
-        ref_val = schema["$ref"]
-        def_name = ref_val.split("/")[-1] if "/" in ref_val else ref_val
-        hint = f"See: {def_name}"
-        existing_desc = schema.get("description", "")
-        new_description = f"{existing_desc} ({hint})" if existing_desc else hint
-        return {"type": "object", "description": new_description}
-    
-    # Recursively process all properties
-    result = {}
-    for key, value in schema.items():
-        result[key] = convert_refs_to_hints(value)
-    return result
+def _union_enum_choices(option: dict[str, Any]) -> tuple[Any, ...] | list[Any]:
+    """Return the const/enum values an anyOf/oneOf option contributes."""
+    if "const" in option:
+        return (option["const"],)
+    enum = option.get("enum")
+    if isinstance(enum, list) and len(enum) > 0:
+        return enum
+    return ()
 
 
-def convert_const_to_enum(schema: Any) -> Any:
-    """Convert const to enum."""
-    if not isinstance(schema, dict):
-        return schema
+def try_merge_enum_from_union(options: list[Any]) -> list[str] | None:
+    """Check if anyOf/oneOf represents enum choices."""
+    if not isinstance(options, list) or len(options) == 0:
+        return None
     
-    if isinstance(schema, list):
-        return [convert_const_to_enum(item) for item in schema]
+    # Validate every option before building anything
+    for option in options:
+        if not isinstance(option, dict):
+            return None
+        
+        if _union_enum_choices(option):
+            continue
+        
+        # If option has complex structure, it's not a simple enum
+        if any(key in option for key in ("properties", "items", "anyOf", "oneOf", "allOf")):
+            return None
+        
+        # If option has only type (no const/enum), it's not an enum pattern
+        if "type" in option and "enum" not in option:
+            return None
     
-    result = {}
-    for key, value in schema.items():
-        if key == "const" and "enum" not in schema:
-            result["enum"] = [value]
-        else:
-            result[key] = convert_const_to_enum(value)
-    return result
+    enum_values = [str(value) for option in options for value in _union_enum_choices(option)]
+    return enum_values if enum_values else None
 
 
-def add_enum_hints(schema: Any) -> Any:
-    """Add enum hints to description."""
-    if not isinstance(schema, dict):
-        return schema
-    
-    if isinstance(schema, list):
-        return [add_enum_hints(item) for item in schema]
-    
-    result = {**schema}
-    
-    # Add enum hint if enum has 2-10 items
-    if "enum" in result and isinstance(result["enum"], list):
-        if 1 < len(result["enum"]) <= 10:
-            vals = ", ".join(str(v) for v in result["enum"])
-            result = append_description_hint(result, f"Allowed: {vals}")
+# Bit flags for the cleaning passes, in pipeline order. The fused walker
+# tracks which passes still apply to each child value, because content pulled
+# in by allOf merging or anyOf/oneOf flattening skips the earlier passes.
+_REFS = 1 << 0
+_CONST = 1 << 1
+_ENUM_HINTS = 1 << 2
+_ALL_OF = 1 << 3
+_UNIONS = 1 << 4
+_KEYWORDS = 1 << 5
+_PLACEHOLDER = 1 << 6
+_ALL_PASSES = (1 << 7) - 1
+
+
+def _passes_from(passes: int, stage: int) -> int:
+    """Return the subset of passes that run at or after stage."""
+    return passes & ~(stage - 1)
+
+
+def _clean_node(node: Any, passes: int, in_properties: bool = False) -> Any:
+    """
+    Apply the selected cleaning passes to a schema node in a single walk.
+    
+    Produces the same result as running the passes one after another over the
+    whole tree: node-local rewrites run in pass order, then each child is
+    visited once with the passes that would still have reached it. Children
+    are visited from an explicit stack rather than by recursion; only a chain
+    of anyOf/oneOf options selected one inside another recurses, one frame
+    per level.
+    """
+    if not isinstance(node, dict) or not passes:
+        return node
     
-    # Recursively process nested objects
-    for key, value in result.items():
-        if key != "enum" and isinstance(value, (dict, list)):
-            result[key] = add_enum_hints(value)
+    root, root_pending = _rewrite_node(node, passes, in_properties)
+    stack = [(root, root_pending, in_properties)]
     
-    return result
+    while stack:
+        parent, pending, parent_in_properties = stack.pop()
+        for key, value in parent.items():
+            child_passes = pending.get(key, 0)
+            if not child_passes:
+                continue
+            if isinstance(value, dict):
+                child_in_properties = key == "properties" and not parent_in_properties
+                child, child_pending = _rewrite_node(value, child_passes, child_in_properties)
+                parent[key] = child
+                stack.append((child, child_pending, child_in_properties))
+            elif isinstance(value, list) and child_passes & _KEYWORDS and not parent_in_properties:
+                items = parent[key] = [*value]
+                for index, item in enumerate(items):
+                    if isinstance(item, dict):
+                        child, child_pending = _rewrite_node(item, _KEYWORDS, False)
+                        items[index] = child
+                        stack.append((child, child_pending, False))
+    
+    return root
 
 
-def merge_all_of(schema: Any) -> Any:
-    """Merge allOf schemas into a single object."""
-    if not isinstance(schema, dict):
-        return schema
+def _rewrite_node(
+    node: dict[str, Any], passes: int, in_properties: bool
+) -> tuple[dict[str, Any], dict[str, int]]:
+    """
+    Apply the node-local rewrites of the selected passes to one schema node.
     
-    if isinstance(schema, list):
-        return [merge_all_of(item) for item in schema]
+    Returns the rewritten copy and, per key, the passes its value still needs.
+    """
+    if _is_scalar_leaf(node):
+        return {**node}, {}
     
-    result = {**schema}
+    result = {**node}
+    pending = dict.fromkeys(result, passes)
     
-    # If this object has allOf, merge its contents
-    if "allOf" in result and isinstance(result["allOf"], list):
+    if passes & _REFS and "$ref" in result:
+        ref_val = result["$ref"]
+        def_name = ref_val.split("/")[-1] if "/" in ref_val else ref_val
+        hint = f"See: {def_name}"
+        existing_desc = result.get("description", "")
+        new_description = f"{existing_desc} ({hint})" if existing_desc else hint
+        result = {"type": "object", "description": new_description}
+        pending = {}
+    
+    if passes & _CONST and "const" in result and "enum" not in result:
+        const_value = _clean_node(result["const"], passes & _REFS)
+        result = {
+            ("enum" if key == "const" else key): ([const_value] if key == "const" else value)
+            for key, value in result.items()
+        }
+        pending = {
+            ("enum" if key == "const" else key): (
+                _passes_from(passes, _ENUM_HINTS) if key == "const" else key_passes
+            )
+            for key, key_passes in pending.items()
+        }
+    
+    if passes & _ENUM_HINTS:
+        if "enum" in result and isinstance(result["enum"], list):
+            if 1 < len(result["enum"]) <= 10:
+                vals = ", ".join(str(v) for v in result["enum"])
+                _append_description_hint_in_place(result, f"Allowed: {vals}")
+        if "enum" in pending:
+            pending["enum"] &= ~_ENUM_HINTS
+    
+    if passes & _ALL_OF and "allOf" in result and isinstance(result["allOf"], list):
         merged: dict[str, Any] = {}
         merged_required: list[str] = []
         
         for item in result["allOf"]:
             if not isinstance(item, dict):
                 continue
-            
-            # Merge properties
             if "properties" in item and isinstance(item["properties"], dict):
                 merged.setdefault("properties", {}).update(item["properties"])
-            
-            # Merge required arrays
             if "required" in item and isinstance(item["required"], list):
                 for req in item["required"]:
                     if req not in merged_required:
                         merged_required.append(req)
-            
-            # Copy other fields
             for key, value in item.items():
                 if key not in ("properties", "required") and key not in merged:
                     merged[key] = value
         
-        # Apply merged content
+        merged_passes = _passes_from(passes, _ALL_OF)
         if merged.get("properties"):
-            result.setdefault("properties", {}).update(merged["properties"])
+            # Bring existing properties up to the allOf stage before merging
+            # in the raw ones, then run the remaining passes over all of them.
+            existing_props = _clean_node(
+                result.get("properties", {}),
+                pending.get("properties", 0) & (_ALL_OF - 1),
+            )
+            result["properties"] = {**existing_props, **merged["properties"]}
+            pending["properties"] = merged_passes
         if merged_required:
             existing_required = result.get("required", [])
-            result["required"] = list(set(existing_required + merged_required))
-        
-        # Copy other merged fields
+            result["required"] = list(dict.fromkeys([*existing_required, *merged_required]))
         for key, value in merged.items():
             if key not in ("properties", "required") and key not in result:
                 result[key] = value
+                pending[key] = merged_passes
         
         del result["allOf"]
     
-    # Recursively process nested objects
-    for key, value in list(result.items()):
-        if isinstance(value, (dict, list)):
-            result[key] = merge_all_of(value)
-    
-    return result
-
-
-def try_merge_enum_from_union(options: list[Any]) -> list[str] | None:
-    """Check if anyOf/oneOf represents enum choices."""
-    if not isinstance(options, list) or len(options) == 0:
-        return None
-    
-    enum_values: list[str] = []
-    
-    for option in options:
-        if not isinstance(option, dict):
-            return None
-        
-        # Check for const value
-        if "const" in option:
-            enum_values.append(str(option["const"]))
-            continue
-        
-        # Check for single-value enum
-        if "enum" in option and isinstance(option["enum"], list) and len(option["enum"]) == 1:
-            enum_values.append(str(option["enum"][0]))
-            continue
-        
-        # Check for multi-value enum
-        if "enum" in option and isinstance(option["enum"], list) and len(option["enum"]) > 0:
-            for val in option["enum"]:
-                enum_values.append(str(val))
-            continue
-        
-        # If option has complex structure, it's not a simple enum
-        if any(key in option for key in ("properties", "items", "anyOf", "oneOf", "allOf")):
-            return None
-        
-        # If option has only type (no const/enum), it's not an enum pattern
-        if "type" in option and "const" not in option and "enum" not in option:
-            return None
-    
-    return enum_values if enum_values else None
-
-
-def flatten_any_of_one_of(schema: Any) -> Any:
-    """Flatten anyOf/oneOf to the best option with type hints."""
-    if not isinstance(schema, dict):
-        return schema
-    
-    if isinstance(schema, list):
-        return [flatten_any_of_one_of(item) for item in schema]
-    
-    result = {**schema}
-    
-    for union_key in ("anyOf", "oneOf"):
-        if union_key in result and isinstance(result[union_key], list) and len(result[union_key]) > 0:
-            options = result[union_key]
-            parent_desc = result.get("description", "")
-            
-            # Check if this is an enum pattern
-            merged_enum = try_merge_enum_from_union(options)
-            if merged_enum is not None:
-                new_result = {k: v for k, v in result.items() if k != union_key}
-                new_result["type"] = "string"
-                new_result["enum"] = merged_enum
+    if passes & _UNIONS:
+        for union_key in ("anyOf", "oneOf"):
+            if union_key in result and isinstance(result[union_key], list) and len(result[union_key]) > 0:
+                options = result[union_key]
+                parent_desc = result.get("description", "")
+                
+                merged_enum = try_merge_enum_from_union(options)
+                if merged_enum is not None:
+                    result = {k: v for k, v in result.items() if k != union_key}
+                    result["type"] = "string"
+                    result["enum"] = merged_enum
+                    if parent_desc:
+                        result["description"] = parent_desc
+                    continue
+                
+                # Only the selected option's own keys are flattened here; its
+                # children go on the walker's stack with the passes they still
+                # need, so nested unions cost one frame per level.
+                option = options[0]
+                if isinstance(option, dict):
+                    selected, selected_pending = _rewrite_node(option, _UNIONS, False)
+                else:
+                    selected, selected_pending = option, {}
+                selected = selected or {"type": "string"}
+                
                 if parent_desc:
-                    new_result["description"] = parent_desc
-                result = new_result
-                continue
-            
-            # Not an enum - select first option
-            selected = flatten_any_of_one_of(options[0]) or {"type": "string"}
-            
-            # Preserve parent description
-            if parent_desc:
-                child_desc = selected.get("description", "")
-                if child_desc and child_desc != parent_desc:
-                    selected = {**selected, "description": f"{parent_desc} ({child_desc})"}
-                elif not child_desc:
-                    selected = {**selected, "description": parent_desc}
-            
-            # Replace result
-            new_result = {k: v for k, v in result.items() if k not in (union_key, "description")}
-            result = {**new_result, **selected}
-    
-    # Recursively process nested objects
-    for key, value in list(result.items()):
-        if isinstance(value, (dict, list)):
-            result[key] = flatten_any_of_one_of(value)
-    
-    return result
-
-
-def remove_unsupported_keywords(schema: Any, inside_properties: bool = False) -> Any:
-    """Remove unsupported keywords after hints have been extracted."""
-    if not isinstance(schema, dict):
-        return schema
-    
-    if isinstance(schema, list):
-        return [remove_unsupported_keywords(item, False) for item in schema]
-    
-    result = {}
-    for key, value in schema.items():
-        if not inside_properties and key in UNSUPPORTED_KEYWORDS:
-            continue
-        
-        if isinstance(value, dict):
-            if key == "properties":
-                props_result = {}
-                for prop_name, prop_schema in value.items():
-                    props_result[prop_name] = remove_unsupported_keywords(prop_schema, False)
-                result[key] = props_result
-            else:
-                result[key] = remove_unsupported_keywords(value, False)
-        elif isinstance(value, list):
-            result[key] = [remove_unsupported_keywords(item, False) for item in value]
-        else:
-            result[key] = value
-    
-    return result
-
-
-def add_empty_schema_placeholder(schema: Any) -> Any:
-    """Add placeholder property for empty object schemas."""
-    if not isinstance(schema, dict):
-        return schema
-    
-    if isinstance(schema, list):
-        return [add_empty_schema_placeholder(item) for item in schema]
-    
-    result = {**schema}
-    
-    # Check if this is an empty object schema
-    is_object_type = result.get("type") == "object"
-    
-    if is_object_type:
+                    child_desc = selected.get("description", "")
+                    if child_desc and child_desc != parent_desc:
+                        selected = {**selected, "description": f"{parent_desc} ({child_desc})"}
+                    elif not child_desc:
+                        selected = {**selected, "description": parent_desc}
+                
+                new_result = {k: v for k, v in result.items() if k not in (union_key, "description")}
+                result = {**new_result, **selected}
+                selected_passes = _passes_from(passes, _KEYWORDS)
+                for key in selected:
+                    pending[key] = selected_pending.get(key, 0) | selected_passes
+    
+    if passes & _KEYWORDS and not in_properties:
+        result = {k: v for k, v in result.items() if k not in UNSUPPORTED_KEYWORDS}
+    
+    if passes & _PLACEHOLDER and result.get("type") == "object":
         properties = result.get("properties", {})
-        has_properties = isinstance(properties, dict) and len(properties) > 0
-        
-        if not has_properties:
+        if not (isinstance(properties, dict) and len(properties) > 0):
             result["properties"] = {
                 EMPTY_SCHEMA_PLACEHOLDER_NAME: {
                     "type": "boolean",
@@ -303,43 +286,96 @@ def add_empty_schema_placeholder(schema: Any) -> Any:
                 }
             }
             result["required"] = [EMPTY_SCHEMA_PLACEHOLDER_NAME]
+            pending["properties"] = 0
     
-    # Recursively process nested objects
-    for key, value in list(result.items()):
-        if isinstance(value, (dict, list)):
-            result[key] = add_empty_schema_placeholder(value)
-    
-    return result
+    return result, pending
 
 
+# Results are not memoized: a JSON round-trip cache keyed on the serialized
+# schema measured slower on hits than running the fused walker, and a
+# shape-keyed plan cache (abstracting descriptions/titles and replaying a
+# cleaned template) was ~2x the walker's cost, since building the skeleton
+# and restoring the text each take a full traversal of their own.
 def clean_json_schema_for_antigravity(schema: Any) -> Any:
     """
     Clean a JSON schema for Antigravity API compatibility.
     
     Transforms unsupported features into description hints while preserving
-    semantic information.
+    semantic information. Every cleaning pass runs in one traversal.
     """
-    if not isinstance(schema, dict):
-        return schema
-    
-    result = schema
-    
-    # Phase 1: Convert and add hints
-    result = convert_refs_to_hints(result)
-    result = convert_const_to_enum(result)
-    result = add_enum_hints(result)
-    
-    # Phase 2: Flatten complex structures
-    result = merge_all_of(result)
-    result = flatten_any_of_one_of(result)
-    
-    # Phase 3: Cleanup
-    result = remove_unsupported_keywords(result)
+    return _clean_node(schema, _ALL_PASSES)
+
+
+# Individual passes, for callers that need just one. Each runs the fused
+# walker with a single pass selected.
+def convert_refs_to_hints(schema: Any) -> Any:
+    """Convert $ref to description hints."""
+    return _clean_node(schema, _REFS)
+
+
+def convert_const_to_enum(schema: Any) -> Any:
+    """Convert const to enum."""
+    return _clean_node(schema, _CONST)
+
+
+def add_enum_hints(schema: Any) -> Any:
+    """Add enum hints to description."""
+    return _clean_node(schema, _ENUM_HINTS)
+
+
+def merge_all_of(schema: Any) -> Any:
+    """Merge allOf schemas into a single object."""
+    return _clean_node(schema, _ALL_OF)
+
+
+def flatten_any_of_one_of(schema: Any) -> Any:
+    """Flatten anyOf/oneOf to the best option with type hints."""
+    return _clean_node(schema, _UNIONS)
+
+
+def remove_unsupported_keywords(schema: Any, inside_properties: bool = False) -> Any:
+    """Remove unsupported keywords after hints have been extracted."""
+    if not inside_properties or not isinstance(schema, dict):
+        return _clean_node(schema, _KEYWORDS)
+    # Keep this level's keys; clean the values as a schema's values would be.
+    return {
+        key: (
+            _clean_node(value, _KEYWORDS, key == "properties") if isinstance(value, dict)
+            else [_clean_node(item, _KEYWORDS) for item in value] if isinstance(value, list)
+            else value
+        )
+        for key, value in schema.items()
+    }
+
+
+def add_empty_schema_placeholder(schema: Any) -> Any:
+    """Add placeholder property for empty object schemas."""
+    return _clean_node(schema, _PLACEHOLDER)
+
+
+def _format_parameter_type(prop: dict[str, Any]) -> str:
+    """Describe a single property's type for the parameter signature."""
+    prop_type = prop.get("type", "any")
+    
+    # Handle array types
+    if prop_type == "array":
+        items = prop.get("items", {})
+        item_type = items.get("type", "any")
+        if item_type == "object" and "properties" in items:
+            # Summarize object properties
+            item_parts = ", ".join(
+                f"{item_name}: {item_prop.get('type', 'any')}"
+                for item_name, item_prop in items["properties"].items()
+            )
+            prop_type = f"ARRAY_OF_OBJECTS[{item_parts}]"
+        else:
+            prop_type = f"ARRAY_OF_{item_type.upper()}"
     
-    # Phase 4: Add placeholder for empty object schemas
-    result = add_empty_schema_placeholder(result)
+    # Handle enum types
+    if "enum" in prop and isinstance(prop["enum"], list):
+        prop_type = f"{prop_type} ENUM[{len(prop['enum'])} options]"
     
-    return result
+    return prop_type
 
 
 def format_parameter_signature(properties: dict[str, Any], required: list[str] | None = None) -> str:
@@ -347,34 +383,8 @@ def format_parameter_signature(properties: dict[str, Any], required: list[str] |
     if not properties:
         return ""
     
-    required_set = set(required or [])
-    parts = []
-    
-    for name, prop in properties.items():
-        prop_type = prop.get("type", "any")
-        
-        # Handle array types
-        if prop_type == "array":
-            items = prop.get("items", {})
-            item_type = items.get("type", "any")
-            prop_type = f"ARRAY_OF_{item_type.upper()}"
-            if item_type == "object" and "properties" in items:
-                # Summarize object properties
-                item_props = items["properties"]
-                item_parts = []
-                for item_name, item_prop in item_props.items():
-                    item_parts.append(f"{item_name}: {item_prop.get('type', 'any')}")
-                prop_type = f"ARRAY_OF_OBJECTS[{', '.join(item_parts)}]"
-        
-        # Handle enum types
-        if "enum" in prop and isinstance(prop["enum"], list):
-            enum_count = len(prop["enum"])
-            prop_type = f"{prop_type} ENUM[{enum_count} options]"
-        
-        # Mark required
-        if name in required_set:
-            parts.append(f"{name} ({prop_type}, REQUIRED)")
-        else:
-            parts.append(f"{name} ({prop_type})")
-    
-    return ", ".join(parts)
\ No newline at end of file
+    required_set = set(required or ())
+    return ", ".join(
+        f"{name} ({_format_parameter_type(prop)}{', REQUIRED)' if name in required_set else ')'}"
+        for name, prop in properties.items()
+    )
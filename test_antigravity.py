@@ -8,6 +8,7 @@ Prerequisites:
 
 Usage:
     python test_antigravity.py
+    pytest test_antigravity.py    # skipped without stored auth
 """
 
 import asyncio
@@ -22,12 +23,30 @@ if sys.platform == "win32":
 # Add the parent directory to the path so we can import langchain_antigravity
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    import pytest
+    import pytest_asyncio
+except ImportError:  # pytest is optional when running as a script
+    pytest = None
+
+from langchain_antigravity._test_support import _BufferedStdout, _prepare_auth, _run_test
 from langchain_antigravity.auth import load_auth_from_storage, refresh_access_token
 from langchain_antigravity.chat_model import ChatAntigravity
 
 PROJECT_ID = os.environ.get("ANTIGRAVITY_PROJECT_ID", "").strip() or None
 
 
+if pytest is not None:
+
+    @pytest_asyncio.fixture(scope="session")
+    async def auth():
+        """Antigravity auth, loaded and refreshed once per session."""
+        auth = await _prepare_auth(load_auth_from_storage, refresh_access_token)
+        if auth is None:
+            pytest.skip("No Antigravity authentication (run 'ag-auth login')")
+        return auth
+
+
 # Define a simple tool for testing
 def get_weather(location: str) -> str:
     """Get the current weather for a location.
@@ -42,27 +61,12 @@ def get_weather(location: str) -> str:
     return f"The weather in {location} is sunny and 72°F."
 
 
-async def test_simple_chat():
+async def test_simple_chat(auth):
     """Test a simple chat without tools."""
     print("\n" + "="*60)
     print("TEST 1: Simple Chat")
     print("="*60)
     
-    # Check if we have authentication
-    auth = load_auth_from_storage()
-    if not auth:
-        print("❌ No authentication found!")
-        print("   Run 'antigravity login' first to authenticate.")
-        return False
-    
-    print(f"✓ Found auth for: {auth.email or 'unknown'}")
-    
-    # Refresh if expired
-    if auth.is_expired():
-        print("  Token expired, refreshing...")
-        auth = await refresh_access_token(auth)
-        print("  ✓ Token refreshed")
-    
     # Create chat model
     chat = ChatAntigravity(
         model="antigravity-gemini-3-flash",
@@ -73,32 +77,20 @@ async def test_simple_chat():
     print(f"\nUsing model: {chat.model}")
     print("Sending: 'Hello! What's 2 + 2?'\n")
     
-    try:
-        response = await chat.ainvoke([
-            {"role": "user", "content": "Hello! What's 2 + 2?"}
-        ])
-        print(f"Response: {response.content}")
-        print("\n✓ Simple chat test PASSED")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+    response = await chat.ainvoke([
+        {"role": "user", "content": "Hello! What's 2 + 2?"}
+    ])
+    print(f"Response: {response.content}")
+    assert response.content, "empty response"
+    print("\n✓ Simple chat test PASSED")
 
 
-async def test_tool_use():
+async def test_tool_use(auth):
     """Test tool/function calling."""
     print("\n" + "="*60)
     print("TEST 2: Tool Use")
     print("="*60)
     
-    auth = load_auth_from_storage()
-    if not auth:
-        print("❌ No authentication found!")
-        return False
-    
-    if auth.is_expired():
-        auth = await refresh_access_token(auth)
-    
     # Create a simple tool schema
     weather_tool = {
         "name": "get_weather",
@@ -126,45 +118,28 @@ async def test_tool_use():
     print("Bound tool: get_weather")
     print("Sending: 'What's the weather like in San Francisco?'\n")
     
-    try:
-        response = await chat.ainvoke([
-            {"role": "user", "content": "What's the weather like in San Francisco?"}
-        ])
-        
-        print(f"Response content: {response.content or '(empty - tool call made)'}")
-        
-        if response.tool_calls:
-            print(f"\nTool calls made:")
-            for tc in response.tool_calls:
-                print(f"  - {tc['name']}({tc['args']})")
-            print("\n✓ Tool use test PASSED - Model correctly called the tool!")
-            return True
-        else:
-            print("\n⚠ Model responded without using the tool")
-            print("  This may still be valid depending on the model's behavior")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    response = await chat.ainvoke([
+        {"role": "user", "content": "What's the weather like in San Francisco?"}
+    ])
+    
+    print(f"Response content: {response.content or '(empty - tool call made)'}")
+    
+    if response.tool_calls:
+        print(f"\nTool calls made:")
+        for tc in response.tool_calls:
+            print(f"  - {tc['name']}({tc['args']})")
+        print("\n✓ Tool use test PASSED - Model correctly called the tool!")
+    else:
+        print("\n⚠ Model responded without using the tool")
+        print("  This may still be valid depending on the model's behavior")
 
 
-async def test_streaming():
+async def test_streaming(auth):
     """Test streaming responses."""
     print("\n" + "="*60)
     print("TEST 3: Streaming")
     print("="*60)
     
-    auth = load_auth_from_storage()
-    if not auth:
-        print("❌ No authentication found!")
-        return False
-    
-    if auth.is_expired():
-        auth = await refresh_access_token(auth)
-    
     chat = ChatAntigravity(
         model="antigravity-gemini-3-flash",
         auth=auth,
@@ -173,21 +148,16 @@ async def test_streaming():
     
     print(f"Using model: {chat.model}")
     print("Sending: 'Count from 1 to 5 slowly.'\n")
-    print("Streaming response: ", end="", flush=True)
     
-    try:
-        async for chunk in chat.astream([
-            {"role": "user", "content": "Count from 1 to 5 slowly."}
-        ]):
-            if chunk.content:
-                print(chunk.content, end="", flush=True)
-        
-        print("\n\n✓ Streaming test PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        return False
+    chunks = []
+    async for chunk in chat.astream([
+        {"role": "user", "content": "Count from 1 to 5 slowly."}
+    ]):
+        if chunk.content:
+            chunks.append(chunk.content)
+    
+    print(f"Streaming response ({len(chunks)} chunks): {''.join(chunks)}")
+    print("\n✓ Streaming test PASSED")
 
 
 async def main():
@@ -196,16 +166,33 @@ async def main():
     print("LangChain Antigravity Integration Tests")
     print("="*60)
     
-    results = []
+    # Load (and refresh) auth once and share it across the tests
+    auth = await _prepare_auth(load_auth_from_storage, refresh_access_token)
+    if not auth:
+        print("❌ No authentication found!")
+        print("   Run 'antigravity login' first to authenticate.")
+        return False
     
-    # Test 1: Simple chat
-    results.append(("Simple Chat", await test_simple_chat()))
+    print(f"✓ Found auth for: {auth.email or 'unknown'}")
     
-    # Test 2: Tool use
-    results.append(("Tool Use", await test_tool_use()))
+    # The tests are independent round-trips: run them concurrently with their
+    # output captured, then replay it in order
+    tests = (
+        ("Simple Chat", test_simple_chat(auth)),
+        ("Tool Use", test_tool_use(auth)),
+        ("Streaming", test_streaming(auth)),
+    )
+    real_stdout = sys.stdout
+    sys.stdout = _BufferedStdout(real_stdout)
+    try:
+        outcomes = await asyncio.gather(*(_run_test(name, coro) for name, coro in tests))
+    finally:
+        sys.stdout = real_stdout
     
-    # Test 3: Streaming
-    results.append(("Streaming", await test_streaming()))
+    results = []
+    for name, result, output in outcomes:
+        print(output, end="")
+        results.append((name, result))
     
     # Summary
     print("\n" + "="*60)
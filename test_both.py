@@ -9,24 +9,38 @@ Prerequisites:
 
 Usage:
     python test_both.py
+    pytest test_both.py    # tests without stored auth are skipped
 """
 
 import asyncio
+import contextlib
 import sys
+import time
 from pathlib import Path
+from typing import Any, Final
 
 # Fix Windows console encoding
 if sys.platform == "win32":
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import httpx
+
+try:
+    import pytest
+    import pytest_asyncio
+except ImportError:  # pytest is optional when running as a script
+    pytest = None
+
 import langchain_antigravity.auth as auth_module
 import langchain_antigravity.chat_model as chat_module
 import langchain_antigravity.codex_auth as codex_auth_module
 import langchain_antigravity.codex_chat_model as codex_chat_module
+import langchain_antigravity.response_cache as response_cache_module
+from langchain_antigravity._test_support import _BufferedStdout, _prepare_auth, _run_test
 
 load_auth_from_storage = auth_module.load_auth_from_storage
 refresh_access_token = auth_module.refresh_access_token
@@ -34,242 +48,240 @@ ChatAntigravity = chat_module.ChatAntigravity
 load_codex_auth_from_storage = codex_auth_module.load_codex_auth_from_storage
 refresh_codex_token = codex_auth_module.refresh_codex_token
 ChatCodex = codex_chat_module.ChatCodex
-
-
-def define_simple_tool():
-    """Define a simple tool for testing."""
-    return {
-        "name": "get_weather",
-        "description": "Get the current weather for a location. Use this when user asks about weather.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "location": {
-                    "type": "string",
-                    "description": "The city and state, e.g. 'San Francisco, CA'"
-                }
-            },
-            "required": ["location"]
-        }
+cached_ainvoke = response_cache_module.cached_ainvoke
+
+
+# Cap on tests in flight at once
+MAX_CONCURRENT_TESTS = 6
+
+
+def _shared_http_client():
+    """Pooled client shared by every test against one provider."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=120.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+if pytest is not None:
+
+    @pytest_asyncio.fixture(scope="session")
+    async def google_auth():
+        """Google auth, loaded and refreshed once per session."""
+        auth = await _prepare_auth(load_auth_from_storage, refresh_access_token)
+        if auth is None:
+            pytest.skip("No Google authentication (run 'ag-auth login')")
+        return auth
+
+    @pytest_asyncio.fixture(scope="session")
+    async def codex_auth():
+        """Codex auth, loaded and refreshed once per session."""
+        auth = await _prepare_auth(load_codex_auth_from_storage, refresh_codex_token)
+        if auth is None:
+            pytest.skip("No OpenAI Codex authentication (run 'codex-auth login')")
+        return auth
+
+    @pytest_asyncio.fixture(scope="session")
+    async def ag_client():
+        async with _shared_http_client() as client:
+            yield client
+
+    @pytest_asyncio.fixture(scope="session")
+    async def codex_client():
+        async with _shared_http_client() as client:
+            yield client
+
+
+# Streamed text is written out every STREAM_FLUSH_CHUNKS chunks or
+# STREAM_FLUSH_SECONDS, whichever comes first, instead of once per chunk.
+STREAM_FLUSH_CHUNKS = 8
+STREAM_FLUSH_SECONDS = 0.05
+
+
+async def _echo_stream(chat, messages):
+    """Echo streamed content in batches; returns the number of content chunks."""
+    pending = []
+    chunk_count = 0
+    last_flush = time.monotonic()
+    async for chunk in chat.astream(messages):
+        if not chunk.content:
+            continue
+        pending.append(chunk.content)
+        chunk_count += 1
+        now = time.monotonic()
+        if len(pending) >= STREAM_FLUSH_CHUNKS or now - last_flush > STREAM_FLUSH_SECONDS:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            pending.clear()
+            last_flush = now
+    if pending:
+        sys.stdout.write("".join(pending))
+        sys.stdout.flush()
+    return chunk_count
+
+
+# Simple tool shared by the tool-use tests. A plain dict: both bind_tools
+# implementations only accept raw tool definitions that are dicts.
+WEATHER_TOOL: Final[dict[str, Any]] = {
+    "name": "get_weather",
+    "description": "Get the current weather for a location. Use this when user asks about weather.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "location": {
+                "type": "string",
+                "description": "The city and state, e.g. 'San Francisco, CA'"
+            }
+        },
+        "required": ["location"]
     }
+}
 
 
-async def test_antigravity_simple_chat():
+async def test_antigravity_simple_chat(google_auth, ag_client):
     """Test Google Antigravity simple chat."""
     print("\n" + "="*60)
     print("GOOGLE ANTIGRAVITY TEST 1: Simple Chat")
     print("="*60)
 
-    auth = load_auth_from_storage()
-    if not auth:
-        print("❌ No Google authentication found!")
-        print("   Run 'ag-auth login' first to authenticate.")
-        return False
-
-    print(f"✓ Found Google auth for: {auth.email or 'unknown'}")
+    print(f"✓ Found Google auth for: {google_auth.email or 'unknown'}")
 
-    if auth.is_expired():
-        print("  Token expired, refreshing...")
-        auth = await refresh_access_token(auth)
-        print("  ✓ Token refreshed")
-
-    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=auth)
+    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=google_auth, http_client=ag_client)
 
     print(f"\nUsing model: {chat.model}")
     print("Sending: 'Hello! What's 2 + 2?'\n")
 
-    try:
-        response = await chat.ainvoke([{"role": "user", "content": "Hello! What's 2 + 2?"}])
-        print(f"Response: {response.content}")
-        print("\n✓ Google Antigravity simple chat test PASSED")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+    response = await cached_ainvoke(chat, [{"role": "user", "content": "Hello! What's 2 + 2?"}])
+    print(f"Response: {response.content}")
+    assert response.content, "empty response"
+    print("\n✓ Google Antigravity simple chat test PASSED")
 
 
-async def test_codex_simple_chat():
+async def test_codex_simple_chat(codex_auth, codex_client):
     """Test OpenAI Codex simple chat."""
     print("\n" + "="*60)
     print("OPENAI CODEX TEST 1: Simple Chat")
     print("="*60)
 
-    auth = load_codex_auth_from_storage()
-    if not auth:
-        print("❌ No OpenAI/Codex authentication found!")
-        print("   Run 'codex-auth login' first to authenticate.")
-        return False
-
-    print(f"✓ Found OpenAI auth for account: {auth.account_id or 'unknown'}")
-
-    if auth.is_expired():
-        print("  Token expired, refreshing...")
-        auth = await refresh_codex_token(auth)
-        print("  ✓ Token refreshed")
+    print(f"✓ Found OpenAI auth for account: {codex_auth.account_id or 'unknown'}")
 
-    chat = ChatCodex(model="gpt-5.2-codex", auth=auth)
+    chat = ChatCodex(model="gpt-5.2-codex", auth=codex_auth, http_client=codex_client)
 
     print(f"\nUsing model: {chat.model}")
     print("Sending: 'Hello! What's 2 + 2?'\n")
 
-    try:
-        response = await chat.ainvoke([{"role": "user", "content": "Hello! What's 2 + 2?"}])
-        print(f"Response: {response.content}")
-        print("\n✓ OpenAI Codex simple chat test PASSED")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+    response = await cached_ainvoke(chat, [{"role": "user", "content": "Hello! What's 2 + 2?"}])
+    print(f"Response: {response.content}")
+    assert response.content, "empty response"
+    print("\n✓ OpenAI Codex simple chat test PASSED")
 
 
-async def test_antigravity_tool_use():
+async def test_antigravity_tool_use(google_auth, ag_client):
     """Test Google Antigravity tool calling."""
     print("\n" + "="*60)
     print("GOOGLE ANTIGRAVITY TEST 2: Tool Use")
     print("="*60)
 
-    auth = load_auth_from_storage()
-    if not auth:
-        return False
-
-    if auth.is_expired():
-        auth = await refresh_access_token(auth)
-
-    weather_tool = define_simple_tool()
-    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=auth).bind_tools([weather_tool])
+    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=google_auth, http_client=ag_client).bind_tools([WEATHER_TOOL])
 
     print(f"Using model: {chat.model}")
     print("Bound tool: get_weather")
     print("Sending: 'What's the weather in San Francisco?'\n")
 
-    try:
-        response = await chat.ainvoke([{"role": "user", "content": "What's the weather in San Francisco?"}])
+    response = await cached_ainvoke(
+        chat,
+        [{"role": "user", "content": "What's the weather in San Francisco?"}],
+        key_extra=(WEATHER_TOOL,),
+    )
 
-        print(f"Response content: {response.content or '(empty - tool call made)'}")
+    print(f"Response content: {response.content or '(empty - tool call made)'}")
 
-        if response.tool_calls:
-            print(f"\nTool calls made:")
-            for tc in response.tool_calls:
-                print(f"  - {tc['name']}({tc['args']})")
-            print("\n✓ Google Antigravity tool use test PASSED")
-            return True
-        else:
-            print("\n⚠ Model responded without using the tool")
-            print("  This may still be valid depending on the model's behavior")
-            return True
-
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if response.tool_calls:
+        print(f"\nTool calls made:")
+        for tc in response.tool_calls:
+            print(f"  - {tc['name']}({tc['args']})")
+        print("\n✓ Google Antigravity tool use test PASSED")
+    else:
+        print("\n⚠ Model responded without using the tool")
+        print("  This may still be valid depending on the model's behavior")
 
 
-async def test_codex_tool_use():
+async def test_codex_tool_use(codex_auth, codex_client):
     """Test OpenAI Codex tool calling."""
     print("\n" + "="*60)
     print("OPENAI CODEX TEST 2: Tool Use")
     print("="*60)
 
-    auth = load_codex_auth_from_storage()
-    if not auth:
-        return False
-
-    if auth.is_expired():
-        auth = await refresh_codex_token(auth)
-
-    weather_tool = define_simple_tool()
-    chat = ChatCodex(model="gpt-5.2-codex", auth=auth).bind_tools([weather_tool])
+    chat = ChatCodex(model="gpt-5.2-codex", auth=codex_auth, http_client=codex_client).bind_tools([WEATHER_TOOL])
 
     print(f"Using model: {chat.model}")
     print("Bound tool: get_weather")
     print("Sending: 'What's the weather in San Francisco?'\n")
 
-    try:
-        response = await chat.ainvoke([{"role": "user", "content": "What's the weather in San Francisco?"}])
+    response = await cached_ainvoke(
+        chat,
+        [{"role": "user", "content": "What's the weather in San Francisco?"}],
+        key_extra=(WEATHER_TOOL,),
+    )
 
-        print(f"Response content: {response.content or '(empty - tool call made)'}")
+    print(f"Response content: {response.content or '(empty - tool call made)'}")
 
-        if response.tool_calls:
-            print(f"\nTool calls made:")
-            for tc in response.tool_calls:
-                print(f"  - {tc['name']}({tc['args']})")
-            print("\n✓ OpenAI Codex tool use test PASSED")
-            return True
-        else:
-            print("\n⚠ Model responded without using the tool")
-            print("  This may still be valid depending on the model's behavior")
-            return True
-
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if response.tool_calls:
+        print(f"\nTool calls made:")
+        for tc in response.tool_calls:
+            print(f"  - {tc['name']}({tc['args']})")
+        print("\n✓ OpenAI Codex tool use test PASSED")
+    else:
+        print("\n⚠ Model responded without using the tool")
+        print("  This may still be valid depending on the model's behavior")
 
 
-async def test_antigravity_streaming():
+async def test_antigravity_streaming(google_auth, ag_client):
     """Test Google Antigravity streaming."""
     print("\n" + "="*60)
     print("GOOGLE ANTIGRAVITY TEST 3: Streaming")
     print("="*60)
 
-    auth = load_auth_from_storage()
-    if not auth:
-        return False
-
-    if auth.is_expired():
-        auth = await refresh_access_token(auth)
-
-    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=auth)
+    chat = ChatAntigravity(model="antigravity-gemini-3-flash", auth=google_auth, http_client=ag_client)
 
     print(f"Using model: {chat.model}")
     print("Sending: 'Count from 1 to 5 slowly.'\n")
-    print("Streaming response: ", end="", flush=True)
-
-    try:
-        async for chunk in chat.astream([{"role": "user", "content": "Count from 1 to 5 slowly."}]):
-            if chunk.content:
-                print(chunk.content, end="", flush=True)
+    print("Streaming response: ", end="")
+    chunk_count = await _echo_stream(chat, [{"role": "user", "content": "Count from 1 to 5 slowly."}])
+    print(f"\n({chunk_count} chunks)")
 
-        print("\n\n✓ Google Antigravity streaming test PASSED")
-        return True
-
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        return False
+    print("\n\n✓ Google Antigravity streaming test PASSED")
 
 
-async def test_codex_streaming():
+async def test_codex_streaming(codex_auth, codex_client):
     """Test OpenAI Codex streaming."""
     print("\n" + "="*60)
     print("OPENAI CODEX TEST 3: Streaming")
     print("="*60)
 
-    auth = load_codex_auth_from_storage()
-    if not auth:
-        return False
-
-    if auth.is_expired():
-        auth = await refresh_codex_token(auth)
-
-    chat = ChatCodex(model="gpt-5.2-codex", auth=auth)
+    chat = ChatCodex(model="gpt-5.2-codex", auth=codex_auth, http_client=codex_client)
 
     print(f"Using model: {chat.model}")
     print("Sending: 'Count from 1 to 5 slowly.'\n")
-    print("Streaming response: ", end="", flush=True)
+    print("Streaming response: ", end="")
+    chunk_count = await _echo_stream(chat, [{"role": "user", "content": "Count from 1 to 5 slowly."}])
+    print(f"\n({chunk_count} chunks)")
 
-    try:
-        async for chunk in chat.astream([{"role": "user", "content": "Count from 1 to 5 slowly."}]):
-            if chunk.content:
-                print(chunk.content, end="", flush=True)
+    print("\n\n✓ OpenAI Codex streaming test PASSED")
 
-        print("\n\n✓ OpenAI Codex streaming test PASSED")
-        return True
 
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        return False
+# (summary name, test) per provider, in run order
+GOOGLE_TESTS = (
+    ("Google Simple Chat", test_antigravity_simple_chat),
+    ("Google Tool Use", test_antigravity_tool_use),
+    ("Google Streaming", test_antigravity_streaming),
+)
+CODEX_TESTS = (
+    ("Codex Simple Chat", test_codex_simple_chat),
+    ("Codex Tool Use", test_codex_tool_use),
+    ("Codex Streaming", test_codex_streaming),
+)
 
 
 async def main():
@@ -278,29 +290,50 @@ async def main():
     print("LangChain Antigravity & Codex Integration Tests")
     print("="*60)
 
-    results = []
-
-    # Test Google Antigravity
-    has_google_auth = load_auth_from_storage() is not None
-    if has_google_auth:
-        print("\n🔵 Testing Google Antigravity authentication...")
-        results.append(("Google Simple Chat", await test_antigravity_simple_chat()))
-        results.append(("Google Tool Use", await test_antigravity_tool_use()))
-        results.append(("Google Streaming", await test_antigravity_streaming()))
-    else:
-        print("\n⏭ Skipping Google Antigravity tests (no authentication)")
-        print("  Run 'ag-auth login' to enable Google tests\n")
-
-    # Test OpenAI Codex
-    has_codex_auth = load_codex_auth_from_storage() is not None
-    if has_codex_auth:
-        print("\n🟢 Testing OpenAI Codex authentication...")
-        results.append(("Codex Simple Chat", await test_codex_simple_chat()))
-        results.append(("Codex Tool Use", await test_codex_tool_use()))
-        results.append(("Codex Streaming", await test_codex_streaming()))
-    else:
-        print("\n⏭ Skipping OpenAI Codex tests (no authentication)")
-        print("  Run 'codex-auth login' to enable Codex tests\n")
+    # One pooled HTTP client per provider, closed when the tests finish
+    async with contextlib.AsyncExitStack() as clients:
+        tests = []
+        skipped = 0
+
+        # Test Google Antigravity
+        google_auth = await _prepare_auth(load_auth_from_storage, refresh_access_token)
+        has_google_auth = google_auth is not None
+        if has_google_auth:
+            print("\n🔵 Testing Google Antigravity authentication...")
+            google_client = await clients.enter_async_context(_shared_http_client())
+            tests.extend((name, test(google_auth, google_client)) for name, test in GOOGLE_TESTS)
+        else:
+            skipped += len(GOOGLE_TESTS)
+            print("\n⏭ Skipping Google Antigravity tests (no authentication)")
+            print("  Run 'ag-auth login' to enable Google tests\n")
+
+        # Test OpenAI Codex
+        codex_auth = await _prepare_auth(load_codex_auth_from_storage, refresh_codex_token)
+        has_codex_auth = codex_auth is not None
+        if has_codex_auth:
+            print("\n🟢 Testing OpenAI Codex authentication...")
+            codex_client = await clients.enter_async_context(_shared_http_client())
+            tests.extend((name, test(codex_auth, codex_client)) for name, test in CODEX_TESTS)
+        else:
+            skipped += len(CODEX_TESTS)
+            print("\n⏭ Skipping OpenAI Codex tests (no authentication)")
+            print("  Run 'codex-auth login' to enable Codex tests\n")
+
+        # Run the tests concurrently, then replay their output in order
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+        real_stdout = sys.stdout
+        sys.stdout = _BufferedStdout(real_stdout)
+        try:
+            outcomes = await asyncio.gather(
+                *(_run_test(name, coro, semaphore) for name, coro in tests)
+            )
+        finally:
+            sys.stdout = real_stdout
+
+    results_by_name: dict[str, bool] = {}
+    for name, result, output in outcomes:
+        print(output, end="")
+        results_by_name[name] = result
 
     if not has_google_auth and not has_codex_auth:
         print("\n❌ No authentication found for either platform!")
@@ -312,21 +345,12 @@ async def main():
     print("TEST SUMMARY")
     print("="*60)
 
-    passed = 0
-    failed = 0
-    skipped = 0
-
-    for name, result in results:
-        status = "✓ PASSED" if result else "❌ FAILED"
-        print(f"  {name}: {status}")
-        if result:
-            passed += 1
-        else:
-            failed += 1
-
-    total = has_google_auth * 3 + has_codex_auth * 3
-    skipped = total - len(results)
-
+    passed = sum(results_by_name.values())
+    failed = len(results_by_name) - passed
+    print("\n".join(
+        f"  {name}: {'✓ PASSED' if result else '❌ FAILED'}"
+        for name, result in results_by_name.items()
+    ))
     print(f"\nTotal: {passed} passed, {failed} failed, {skipped} skipped")
 
     if failed > 0:
@@ -2,44 +2,66 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 
+# Provider spellings for each usage counter, in lookup priority order.
+_PROMPT_KEYS = ("promptTokenCount", "prompt_tokens", "input_tokens", "promptTokens", "prompt_token_count")
+_COMPLETION_KEYS = (
+    "candidatesTokenCount",
+    "candidates_tokens",
+    "output_tokens",
+    "completion_tokens",
+    "candidate_tokens",
+)
+_TOTAL_KEYS = ("totalTokenCount", "total_tokens")
+
+
 def _coerce_int(value: Any) -> int | None:
+    # Dispatch on the common shapes first so missing (None) counters don't
+    # go through raise/catch; strings and other types still use int().
+    if value is None:
+        return None
+    kind = type(value)
+    if kind is int:
+        return value
+    if kind is float:
+        return int(value) if math.isfinite(value) else None
     try:
         return int(value)
     except (TypeError, ValueError):
         return None
 
 
+def _first_int(usage: dict[str, Any], keys: tuple[str, ...]) -> int | None:
+    """Coerce the first truthy alias (else the last one), like an `or` chain."""
+    value = None
+    for key in keys:
+        value = usage.get(key)
+        if value:
+            break
+    return _coerce_int(value)
+
+
 def _extract_usage_metadata(response_data: dict[str, Any]) -> tuple[dict[str, int], dict[str, Any]]:
-    inner = response_data.get("response", response_data)
+    # Streaming chunks may carry "response": null; fall back to the top level.
+    resp = response_data.get("response")
+    inner = resp if isinstance(resp, dict) else response_data
+    if not isinstance(inner, dict):
+        return {}, {}
+    return _extract_usage_metadata_fast(inner)
+
+
+def _extract_usage_metadata_fast(inner: dict[str, Any]) -> tuple[dict[str, int], dict[str, Any]]:
+    """Like `_extract_usage_metadata`, for a caller that already unwrapped the envelope."""
     usage = inner.get("usageMetadata") or inner.get("usage") or inner.get("usage_metadata") or {}
     if not isinstance(usage, dict):
         return {}, {}
 
-    prompt = _coerce_int(
-        usage.get("promptTokenCount")
-        or usage.get("prompt_tokens")
-        or usage.get("input_tokens")
-        or usage.get("promptTokens")
-        or usage.get("prompt_token_count")
-    )
-    completion = _coerce_int(
-        usage.get("candidatesTokenCount")
-        or usage.get("candidates_tokens")
-        or usage.get("output_tokens")
-        or usage.get("completion_tokens")
-        or usage.get("candidate_tokens")
-    )
-    total = _coerce_int(
-        usage.get("totalTokenCount")
-        or usage.get("total_tokens")
-        or usage.get("totalTokenCount")
-    )
-
-    if total is None and prompt is not None and completion is not None:
-        total = prompt + completion
+    prompt = _first_int(usage, _PROMPT_KEYS)
+    completion = _first_int(usage, _COMPLETION_KEYS)
+    total = _first_int(usage, _TOTAL_KEYS)
 
     if prompt is None and completion is None and total is None:
         return {}, usage
@@ -48,16 +70,33 @@ def _extract_usage_metadata(response_data: dict[str, Any]) -> tuple[dict[str, in
     completion_tokens = completion or 0
     total_tokens = total if total is not None else prompt_tokens + completion_tokens
 
+    # LangChain UsageMetadata names only; _normalize_token_usage derives the
+    # prompt/completion spelling for llm_output["token_usage"].
     return {
         "input_tokens": prompt_tokens,
         "output_tokens": completion_tokens,
         "total_tokens": total_tokens,
-        "prompt_tokens": prompt_tokens,
-        "completion_tokens": completion_tokens,
     }, usage
 
 
 def _normalize_token_usage(usage_meta: dict[str, int]) -> dict[str, int]:
+    """Project usage metadata onto the ``token_usage`` names used in llm_output."""
+    # Metadata from _extract_usage_metadata (and LangChain's UsageMetadata)
+    # already carries ints under the canonical keys; only project them.
+    try:
+        prompt = usage_meta["input_tokens"]
+        completion = usage_meta["output_tokens"]
+        total = usage_meta["total_tokens"]
+    except KeyError:
+        pass
+    else:
+        if type(prompt) is int and type(completion) is int and type(total) is int:
+            return {
+                "prompt_tokens": prompt,
+                "completion_tokens": completion,
+                "total_tokens": total or prompt + completion,
+            }
+
     prompt = usage_meta.get("prompt_tokens") or usage_meta.get("input_tokens") or 0
     completion = usage_meta.get("completion_tokens") or usage_meta.get("output_tokens") or 0
     total = usage_meta.get("total_tokens") or (prompt + completion)